@@ -17,7 +17,7 @@ sys.path.insert(0, os.path.abspath("."))
 sys.path.insert(0, os.path.abspath("../"))
 sys.path.insert(1, os.path.dirname(os.path.abspath("../")))
 autodoc_mock_imports = ["scipy",
-                        'hampel',
+                        'numba',
                         'pandas',
                         'numpy',
                         'folium',
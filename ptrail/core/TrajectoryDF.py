@@ -162,7 +162,9 @@ class PTRAILDataFrame(DataFrame):
                 data[const.LONG] = data[const.LONG].astype('float64')
             if data.dtypes[const.DateTime] != 'datetime64[ns]':
                 data[const.DateTime] = data[const.DateTime].astype('datetime64[ns]')
-            if data.dtypes[const.TRAJECTORY_ID] != 'str':
+            # An object column never compares equal to 'str', so check the values
+            # themselves and only convert the IDs when they are not all strings yet.
+            if lib.infer_dtype(data[const.TRAJECTORY_ID], skipna=False) != 'string':
                 data[const.TRAJECTORY_ID] = data[const.TRAJECTORY_ID].astype('str')
         except KeyError:
             raise KeyError('dataframe missing one of lat, lon, datetime columns.')
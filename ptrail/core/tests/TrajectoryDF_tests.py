@@ -120,6 +120,14 @@ class TestPTRAILDF(unittest.TestCase):
         self.assertGreater(len(df.traj_id), 0)
         self.assertIsInstance(df.traj_id[0], Text)
 
+    def test_traj_id_converted_to_str(self):
+        df = PTRAILDataFrame(data_set=TestPTRAILDF._dict_data,
+                             latitude='lat',
+                             longitude='lon',
+                             datetime='datetime',
+                             traj_id='id')
+        self.assertListEqual(sorted(df.traj_id.unique()), ['1', '3'])
+
     # ------------------------------- Other Tests -------------------------------- #
     def test_sort(self):
         df = PTRAILDataFrame(data_set=TestPTRAILDF._pdf_data,
@@ -24,7 +24,7 @@ from ptrail.core.TrajectoryDF import PTRAILDataFrame
 from ptrail.features.helper_functions import Helpers
 from ptrail.utilities.DistanceCalculator import FormulaLog
 
-num = os.cpu_count()
+num = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count()
 NUM_CPU = ceil((num * 2) / 3)
 
 
@@ -47,13 +47,10 @@ class Helpers:
         durations = []  # A list for storing results.
 
         # Iterate over each ID and calculate the time duration of each unique ID.
-        for i in range(len(ids_)):
-            # Filter out only the points of the ID in question.
-            small = dataframe.loc[dataframe[const.TRAJECTORY_ID] == ids_[i], [const.DateTime]]
-
+        for id_, small in Helpers._traj_groups(dataframe, ids_, [const.DateTime]):
             # Calculate the duration of the trajectory in question nd append
             # a row containing [traj_duration, traj_id] to the results list.
-            durations.append([(small.max() - small.min())[0], ids_[i]])
+            durations.append([(small.max() - small.min())[0], id_])
 
         # Convert the list containing results to a pandas dataframe, reset the index
         # and then rename the columns.
@@ -89,11 +86,9 @@ class Helpers:
         # Loops over the length of trajectory ids. Filter the dataframe according to each of the ids
         # and then further filter that dataframe according to the earliest(minimum) time.
         # And then append the data of that earliest time into a list.
-        for i in range(len(ids_)):
-            filt = (dataframe.loc[dataframe[const.TRAJECTORY_ID] == ids_[i],
-                                  [const.DateTime, const.LAT, const.LONG]])
+        for id_, filt in Helpers._traj_groups(dataframe, ids_, [const.DateTime, const.LAT, const.LONG]):
             start_time = (filt.loc[filt[const.DateTime] == filt[const.DateTime].min()]).reset_index()
-            results.append([start_time[const.DateTime][0], ids_[i]])
+            results.append([start_time[const.DateTime][0], id_])
 
         # Make a new dataframe containing Latitude Longitude and Trajectory id
         df = pd.DataFrame(results).reset_index(drop=True).rename(columns={0: const.DateTime,
@@ -127,11 +122,9 @@ class Helpers:
         # Loops over the length of trajectory ids. Filter the dataframe according to each of the ids
         # and then further filter that dataframe according to the latest(maximum) time.
         # And then append the data of that latest time into a list.
-        for i in range(len(ids_)):
-            filt = (dataframe.loc[dataframe[const.TRAJECTORY_ID] == ids_[i],
-                                  [const.DateTime, const.LAT, const.LONG]])
+        for id_, filt in Helpers._traj_groups(dataframe, ids_, [const.DateTime, const.LAT, const.LONG]):
             start_time = (filt.loc[filt[const.DateTime] == filt[const.DateTime].max()]).reset_index()
-            results.append([start_time[const.DateTime][0], ids_[i]])
+            results.append([start_time[const.DateTime][0], id_])
 
         # Make a new dataframe containing Latitude Longitude and Trajectory id
         df = pd.DataFrame(results).reset_index(drop=True).rename(columns={0: const.DateTime,
@@ -384,12 +377,10 @@ class Helpers:
         # Loops over the length of trajectory ids. Filter the dataframe according to each of the ids
         # and then further filter that dataframe according to the earliest(minimum) time.
         # And then append the start location of that earliest time into a list
-        for i in range(len(ids_)):
-            filt = (dataframe.loc[dataframe[const.TRAJECTORY_ID] == ids_[i],
-                                  [const.DateTime, const.LAT, const.LONG]])
+        for id_, filt in Helpers._traj_groups(dataframe, ids_, [const.DateTime, const.LAT, const.LONG]):
             start_loc = (filt.loc[filt[const.DateTime] == filt[const.DateTime].min(),
                                   [const.LAT, const.LONG]]).reset_index()
-            results.append([start_loc[const.LAT][0], start_loc[const.LONG][0], ids_[i]])
+            results.append([start_loc[const.LAT][0], start_loc[const.LONG][0], id_])
 
         # Make a new dataframe containing Latitude Longitude and Trajectory id
         df = pd.DataFrame(results).reset_index(drop=True).rename(columns={0: const.LAT,
@@ -426,12 +417,10 @@ class Helpers:
         # Loops over the length of trajectory ids. Filter the dataframe according to each of the ids
         # and then further filter that dataframe according to the latest(maximum) time.
         # And then append the end location of that latest time into a list.
-        for i in range(len(ids_)):
-            filt = (dataframe.loc[dataframe[const.TRAJECTORY_ID] == ids_[i],
-                                  [const.DateTime, const.LAT, const.LONG]])
+        for id_, filt in Helpers._traj_groups(dataframe, ids_, [const.DateTime, const.LAT, const.LONG]):
             start_loc = (filt.loc[filt[const.DateTime] == filt[const.DateTime].max(),
                                   [const.LAT, const.LONG]]).reset_index()
-            results.append([start_loc[const.LAT][0], start_loc[const.LONG][0], ids_[i]])
+            results.append([start_loc[const.LAT][0], start_loc[const.LONG][0], id_])
 
         # Make a new dataframe containing Latitude Longitude and Trajectory id
         df = pd.DataFrame(results).reset_index(drop=True).rename(columns={0: const.LAT,
@@ -465,15 +454,11 @@ class Helpers:
         results = []  # A list for storing results.
 
         # Iterate over each ID and calculate the number of locations visited by each ID.
-        for i in range(len(ids_)):
-            # Filter out only the points of the ID in question.
-            filt = (dataframe.loc[dataframe[const.TRAJECTORY_ID] == ids_[i],
-                                  [const.DateTime, const.LAT, const.LONG]])
-
+        for id_, filt in Helpers._traj_groups(dataframe, ids_, [const.DateTime, const.LAT, const.LONG]):
             # Calculate the total number of unique (lat, lon) points visited
             # by the ID and append a row containing [# of unique locations, traj_id]
             # to the results list.
-            results.append([filt.groupby([const.LAT, const.LONG]).ngroups, ids_[i]])
+            results.append([filt.groupby([const.LAT, const.LONG]).ngroups, id_])
 
         # Convert the list containing results to a pandas dataframe, reset the index
         # and then rename the columns.
@@ -532,6 +517,61 @@ class Helpers:
             raise KeyError(f"The column {dist_column_label} does not exist in the dataset.")
 
     # ------------------------------------ General Utilities ------------------------------------ #
+    @staticmethod
+    def _traj_groups(dataframe, ids_, columns):
+        """
+            Yield the points of each of the given trajectory IDs in the order of ids_.
+            The rows of the IDs are grouped only once, instead of masking the entire
+            dataframe again for every single ID.
+
+            Parameters
+            ----------
+                dataframe: pandas.core.dataframe.DataFrame
+                    The dataframe containing the trajectory ID as a column.
+                ids_: list
+                    The trajectory IDs whose points are to be yielded.
+                columns: list
+                    The columns of the points that are to be yielded.
+
+            Returns
+            -------
+                generator:
+                    (traj_id, dataframe) pairs containing the points of each trajectory.
+        """
+        groups = dataframe.loc[dataframe[const.TRAJECTORY_ID].isin(ids_)].groupby(const.TRAJECTORY_ID,
+                                                                                sort=False)
+        for id_ in ids_:
+            yield id_, groups.get_group(id_)[columns]
+
+    @staticmethod
+    def _time_deltas(dataframe):
+        """
+            Calculate the time difference in seconds between each point and the point
+            before it in the dataframe. The DateTime index level is viewed as int64
+            nanoseconds, so no reset of the index or timedelta series is needed.
+
+            Note
+            ----
+                The differences are the total seconds, same as dt.total_seconds(), and keep
+                their sign. Unlike dt.seconds, a negative time difference is not wrapped
+                around into a positive number of seconds.
+
+            Parameters
+            ----------
+                dataframe: PTRAILDataFrame
+                    The dataframe containing the points.
+
+            Returns
+            -------
+                pandas.core.series.Series
+                    The time differences in seconds, NaN for the first point.
+        """
+        times = dataframe.index.get_level_values(const.DateTime).values.view('i8')
+        deltas = np.empty(len(times))
+        deltas[:1] = np.nan
+        deltas[1:] = np.diff(times) / 1e9
+        return pd.Series(deltas)
+
     @staticmethod
     def _get_partition_size(size):
         """
@@ -550,8 +590,7 @@ class Helpers:
         """
         # Based on the Operating system, get the number of CPUs available for
         # multiprocessing.
-        num = os.cpu_count()
-        num = int(num)
+        num = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count()
         NUM_CPU = ceil((num * 2) / 3)
 
         # Integer divide the total number of Trajectory IDs by the number of available CPUs
@@ -29,7 +29,7 @@ from ptrail.utilities import constants as const
 from ptrail.utilities.DistanceCalculator import FormulaLog as calc
 from ptrail.utilities.exceptions import *
 
-num = os.cpu_count()
+num = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count()
 NUM_CPU = ceil((num * 2) / 3)
 
 
@@ -446,10 +446,8 @@ class KinematicFeatures:
             # then extract it, calculate the time differences between the consecutive
             # rows in the dataframe and then calculate distances/time_deltas in order to
             # calculate the speed.
-            # WARNING!!!! Use dt.total_seconds() as dt.seconds gives false values and as it
-            #             does not account for time difference when it is negative.
             distances = dataframe.reset_index()['Distance']
-            time_deltas = dataframe.reset_index()[const.DateTime].diff().dt.total_seconds()
+            time_deltas = helpers._time_deltas(dataframe)
 
             # Assign the new column and return the NumPandasTrajDF.
             dataframe['Speed'] = (distances / time_deltas.dropna()).to_numpy()
@@ -465,11 +463,9 @@ class KinematicFeatures:
             #   1. Calculate the distance by calling the create_distance_column() function.
             #   2. Calculate the time deltas.
             #   3. Divide the 2 values to calculate the speed.
-            # WARNING!!!! Use dt.total_seconds() as dt.seconds gives false values and as it
-            #             does not account for time difference when it is negative.
             dataframe = KinematicFeatures.create_distance_column(dataframe)
             distances = dataframe.reset_index()['Distance']
-            time_deltas = dataframe.reset_index()[const.DateTime].diff().dt.total_seconds()
+            time_deltas = helpers._time_deltas(dataframe)
 
             # Assign the column and return the NumPandasTrajDF.
             dataframe['Speed'] = (distances / time_deltas).to_numpy(dtype=np.float64)
@@ -506,10 +502,8 @@ class KinematicFeatures:
             # When Speed column is present extract the data from there and then take calculate the time delta
             # And use that to calculate acceleration by dividing speed by time delta and then add the column to
             # the dataframe
-            # WARNING!!!! Use dt.total_seconds() as dt.seconds gives false values and as it
-            #             does not account for time difference when it is negative.
             speed_deltas = dataframe.reset_index()['Speed'].diff()
-            time_deltas = dataframe.reset_index()[const.DateTime].diff().dt.total_seconds()
+            time_deltas = helpers._time_deltas(dataframe)
 
             dataframe['Acceleration'] = (speed_deltas / time_deltas).to_numpy()
             dataframe = dataframe.replace([np.inf, -np.inf], np.nan)
@@ -522,11 +516,9 @@ class KinematicFeatures:
         except KeyError:
             # When Speed column is not present then first call create_speed_from_prev_column() function to make
             # the speed column and then follow the steps mentioned above
-            # WARNING!!!! Use dt.total_seconds() as dt.seconds gives false values and as it
-            #             does not account for time difference when it is negative.
             dataframe = KinematicFeatures.create_speed_column(dataframe)
             speed_deltas = dataframe.reset_index()['Speed'].diff()
-            time_deltas = dataframe.reset_index()[const.DateTime].diff().dt.total_seconds()
+            time_deltas = helpers._time_deltas(dataframe)
 
             dataframe['Acceleration'] = (speed_deltas / time_deltas).to_numpy()
             dataframe = dataframe.replace([np.inf, -np.inf], np.nan)
@@ -562,10 +554,8 @@ class KinematicFeatures:
             # When acceleration column is present extract the data from there and then take calculate the time delta
             # And use that to calculate acceleration by dividing speed_delta by time delta and then add the column to
             # the dataframe
-            # WARNING!!!! Use dt.total_seconds() as dt.seconds gives false values and as it
-            #             does not account for time difference when it is negative.
             acceleration_deltas = dataframe.reset_index()['Acceleration'].diff()
-            time_deltas = dataframe.reset_index()[const.DateTime].diff().dt.total_seconds()
+            time_deltas = helpers._time_deltas(dataframe)
 
             dataframe['Jerk'] = (acceleration_deltas / time_deltas).to_numpy()
             dataframe = dataframe.replace([np.inf, -np.inf], np.nan)
@@ -578,11 +568,9 @@ class KinematicFeatures:
         except KeyError:
             # When Speed column is not present then first call create_speed_from_prev_column() function to make
             # the speed column and then follow the steps mentioned above
-            # WARNING!!!! Use dt.total_seconds() as dt.seconds gives false values and as it
-            #             does not account for time difference when it is negative.
             dataframe = KinematicFeatures.create_acceleration_column(dataframe)
             acceleration_deltas = dataframe.reset_index()['Acceleration'].diff()
-            time_deltas = dataframe.reset_index()[const.DateTime].diff().dt.total_seconds()
+            time_deltas = helpers._time_deltas(dataframe)
 
             dataframe['Jerk'] = (acceleration_deltas / time_deltas).to_numpy()
             dataframe = dataframe.replace([np.inf, -np.inf], np.nan)
@@ -676,10 +664,8 @@ class KinematicFeatures:
             # If Bearing from previous column is present, extract that and then calculate time_deltas
             # Using these calculate Bearing_rate_from_prev by dividing bearing_deltas with time_deltas
             # And then adding the column to the dataframe
-            # WARNING!!!! Use dt.total_seconds() as dt.seconds gives false values and as it
-            #             does not account for time difference when it is negative.
             bearing_deltas = dataframe.reset_index()['Bearing'].diff()
-            time_deltas = dataframe.reset_index()[const.DateTime].diff().dt.total_seconds()
+            time_deltas = helpers._time_deltas(dataframe)
 
             dataframe['Bearing_Rate'] = (bearing_deltas / time_deltas).to_numpy()
             dataframe = dataframe.replace([np.inf, -np.inf], np.nan)
@@ -690,11 +676,9 @@ class KinematicFeatures:
                                    longitude='lon')
         except KeyError:
             # Similar to the step above but just makes the Bearing column first
-            # WARNING!!!! Use dt.total_seconds() as dt.seconds gives false values and as it
-            #             does not account for time difference when it is negative.
             dataframe = KinematicFeatures.create_bearing_column(dataframe)
             bearing_deltas = dataframe.reset_index()['Bearing'].diff()
-            time_deltas = dataframe.reset_index()[const.DateTime].diff().dt.total_seconds()
+            time_deltas = helpers._time_deltas(dataframe)
 
             dataframe['Bearing_Rate'] = (bearing_deltas / time_deltas).to_numpy()
             dataframe = dataframe.replace([np.inf, -np.inf], np.nan)
@@ -731,10 +715,8 @@ class KinematicFeatures:
             # If Bearing from previous column is present, extract that and then calculate time_deltas
             # Using these calculate Bearing_rate_from_prev by dividing bearing_deltas with time_deltas
             # And then adding the column to the dataframe
-            # WARNING!!!! Use dt.total_seconds() as dt.seconds gives false values and as it
-            #             does not account for time difference when it is negative.
             bearing_rate_deltas = dataframe.reset_index()['Bearing_Rate'].diff()
-            time_deltas = dataframe.reset_index()[const.DateTime].diff().dt.total_seconds()
+            time_deltas = helpers._time_deltas(dataframe)
 
             dataframe['Rate_of_bearing_rate'] = (bearing_rate_deltas / time_deltas).to_numpy()
             dataframe = dataframe.replace([np.inf, -np.inf], np.nan)
@@ -745,11 +727,9 @@ class KinematicFeatures:
                                    longitude='lon')
         except KeyError:
             # Similar to the step above but just makes the Bearing column first
-            # WARNING!!!! Use dt.total_seconds() as dt.seconds gives false values and as it
-            #             does not account for time difference when it is negative.
             dataframe = KinematicFeatures.create_bearing_rate_column(dataframe)
             bearing_rate_deltas = dataframe.reset_index()['Bearing'].diff()
-            time_deltas = dataframe.reset_index()[const.DateTime].diff().dt.total_seconds()
+            time_deltas = helpers._time_deltas(dataframe)
 
             dataframe['Rate_of_bearing_rate'] = (bearing_rate_deltas / time_deltas).to_numpy()
             dataframe = dataframe.replace([np.inf, -np.inf], np.nan)
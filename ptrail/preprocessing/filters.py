@@ -6,12 +6,8 @@
     | Authors: Yaksh J Haranwala, Salman Haidri
 """
 import itertools
-import math
-import multiprocessing
-import os
 import warnings
-from math import ceil
-from typing import Text, Optional
+from typing import Text, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -23,9 +19,6 @@ from ptrail.features.temporal_features import TemporalFeatures as temporal
 from ptrail.features.kinematic_features import KinematicFeatures as kinematic
 from ptrail.utilities.exceptions import *
 
-num = os.cpu_count()
-NUM_CPU = ceil((num * 2) / 3)
-
 
 class Filters:
     @staticmethod
@@ -75,7 +68,21 @@ class Filters:
                     in the dataset.
 
         """
-        to_return = dataframe.reset_index().loc[dataframe.reset_index()[const.TRAJECTORY_ID] == traj_id]
+        index = dataframe.index
+        if isinstance(index, pd.MultiIndex) and const.TRAJECTORY_ID in index.names:
+            # Look up the ID only once in the unique values of the index level and then
+            # compare the integer codes of the points instead of resetting the index of
+            # the entire dataframe and comparing the ID with the ID of every point.
+            level = index.names.index(const.TRAJECTORY_ID)
+            code = index.levels[level].get_indexer([traj_id])[0]
+            pos = np.flatnonzero(index.codes[level] == code) if code >= 0 else np.empty(0, dtype=np.intp)
+
+            # Same as before, the points keep their positions in the dataframe as the index.
+            to_return = dataframe.iloc[pos].reset_index()
+            to_return.index = pos
+        else:
+            to_return = dataframe.reset_index().loc[dataframe.reset_index()[const.TRAJECTORY_ID] == traj_id]
+
         if len(to_return) > 0:
             return to_return
         else:
@@ -83,15 +90,17 @@ class Filters:
                                          f"Please check Trajectory ID and try again.")
 
     @staticmethod
-    def get_bounding_box_by_radius(lat: float, lon: float, radius: float):
+    def get_bounding_box_by_radius(lat: Union[float, np.ndarray], lon: Union[float, np.ndarray], radius: float):
         """
             Calculates bounding box from a point according to the given radius.
+            The latitudes and longitudes can also be given as arrays in order to
+            calculate the bounding boxes of several points at once.
 
             Parameters
             ----------
-                lat: float
+                lat: Union[float, numpy.ndarray]
                     The latitude of centroid point of the bounding box.
-                lon: float
+                lon: Union[float, numpy.ndarray]
                     The longitude of centroid point of the bounding box.
                 radius: float
                     The max radius of the bounding box.
@@ -100,25 +109,27 @@ class Filters:
             Returns
             -------
                 tuple:
-                    The bounding box of the user specified size.
+                    The bounding box of the user specified size. If arrays of
+                    coordinates are given, then each of the values is an array
+                    containing the values of all the bounding boxes.
 
             References
             ----------
                 https://mathmesquita.dev/2017/01/16/filtrando-localizacao-em-um-raio.html
         """
-        lat, lon = math.radians(lat), math.radians(lon)  # Convert latitude, longitude to radians.
+        lat, lon = np.radians(lat), np.radians(lon)  # Convert latitude, longitude to radians.
 
         # Calculate the delta factor for the latitudes and then
         # find the minimum and maximum latitudes.
         latitude_delta = radius / (const.RADIUS_OF_EARTH * 1000)
-        lat_one = math.degrees(lat - latitude_delta)
-        lat_two = math.degrees(lat + latitude_delta)
+        lat_one = np.degrees(lat - latitude_delta)
+        lat_two = np.degrees(lat + latitude_delta)
 
         # Calculate the delta factor for the longitudes and then
         # find the minimum and maximum longitudes.
-        longitude_delta = math.asin((math.sin(latitude_delta)) / math.cos(lat))
-        lon_one = math.degrees(lon - longitude_delta)
-        lon_two = math.degrees(lon + longitude_delta)
+        longitude_delta = np.arcsin(np.sin(latitude_delta) / np.cos(lat))
+        lon_one = np.degrees(lon - longitude_delta)
+        lon_two = np.degrees(lon + longitude_delta)
 
         # Return the bounding box.
         return (lat_one, lon_one,
@@ -703,59 +714,19 @@ class Filters:
                 https://github.com/MichaelisTrofficus/hampel_filter
         """
         # Reset the index of the dataframe and then split the original dataframe into
-        # smaller chunks containing a fixed number of trajectory IDs.
+        # smaller chunks containing 1 trajectory ID per chunk.
         df = dataframe.reset_index()
-        df_chunks = helper._df_split_helper(df)
+        df_chunks = [traj for _, traj in df.groupby(const.TRAJECTORY_ID, sort=False)]
 
-        # create a list using the multiprocessing manager to store the returns of the parallel
-        # helper functions.
-        processes = [None] * len(df_chunks)
-        manager = multiprocessing.Manager()
-        return_list = manager.list()
-
-        # Spawn the parallel process and run the hampel filter.
-        for i in range(len(processes)):
-            processes[i] = multiprocessing.Process(target=Filters._hampel,
-                                                   args=(df_chunks[i], column_name, return_list))
-            processes[i].start()
-
-        # Join the helper processes again to free up the CPUs and the main memory.
-        for j in range(len(processes)):
-            processes[j].join()
+        # Run the hampel filter on the trajectories using the pool of processes shared by
+        # the preprocessing modules. The pool returns the filtered trajectories in order, so
+        # there is no need of a multiprocessing manager to collect them.
+        results = helper._get_pool().starmap(helper.hampel_help, zip(df_chunks, itertools.repeat(column_name)))
 
         warnings.warn("If kinematic features have been generated on the dataframe, then make "
                       "sure to generate them again as outlier detection drops the point from "
                       "the dataframe and does not run the kinematic features again.")
 
         # Convert the results back to PTRAILDataFrame and return the resultant dataframe.
-        return PTRAILDataFrame(pd.concat(return_list),
+        return PTRAILDataFrame(pd.concat(results),
                                const.LAT, const.LONG, const.DateTime, const.TRAJECTORY_ID)
-
-    @staticmethod
-    def _hampel(dataframe, column_name: Text, return_list: list):
-        """
-            This is a mid-level helper function for the hampel filter. The
-            purpose of this function is to split the smaller chunks of dataframe
-            received into even smaller chunks containing 1 trajectory ID per chunk,
-            then call the helper function from the helper module and run the hampel filter
-            on it, then merge all the smaller results and append it to the return list.
-        """
-        # Split the smaller dataframe further into smaller chunks containing only 1
-        # Trajectory ID per index.
-        ids_ = list(dataframe[const.TRAJECTORY_ID].value_counts().keys())
-        df_chunks = [dataframe.loc[dataframe[const.TRAJECTORY_ID] == ids_[i]] for i in range(len(ids_))]
-
-        # Here, create as many processes at once as there are number of CPUs available in
-        # the system - 1. One CPU is kept free at all times in order to not block up
-        # the system. (Note: The blocking of system is mostly prevalent in Windows and does
-        # not happen very often in Linux. However, out of caution 1 CPU is kept free regardless
-        # of the system.)
-        small_pool = multiprocessing.Pool(NUM_CPU - 1)
-        final = small_pool.starmap(helper.hampel_help,
-                                   zip(df_chunks, itertools.repeat(column_name)))
-        small_pool.close()
-        small_pool.join()
-
-        return_list.append(pd.concat(final))
-
-
@@ -22,498 +22,649 @@
 
     | Authors: Yaksh J Haranwala, Salman Haidri
 """
+import atexit
 import math
+import multiprocessing
 import os
-from typing import Text, Union
 
 import numpy as np
 import pandas as pd
 import datetime as dt
-from hampel import hampel
-from scipy.interpolate import CubicSpline
+from numba import njit
 
 from ptrail.core.TrajectoryDF import PTRAILDataFrame
-from ptrail.features.kinematic_features import KinematicFeatures as spatial
 from ptrail.utilities import constants as const
 from ptrail.utilities.exceptions import *
 
+# Only count the CPUs that the process is allowed to run on, which can be fewer than
+# the CPUs of the machine when it runs in a container or on a pinned cluster node.
+num = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count()
+NUM_CPU = math.ceil((num * 2) / 3)
+
+# The pool of processes shared by the preprocessing modules. It is created lazily the
+# first time that it is needed and then reused by all the later calls. The ID of the
+# process that created it is stored as well so that forked children do not reuse it.
+_POOL = None
+_POOL_PID = None
+
+
+# ------------------------------------------ Numba Kernels --------------------------------------- #
+# All the kernels are compiled with cache=True so that the compiled machine code is
+# written to __pycache__ and the compilation cost is only paid on the very first run.
+@njit(cache=True)
+def _dist_bearing_stats(lat, lon):
+    """
+        Calculate the mean and standard deviation of the haversine distance and the
+        bearing between all the consecutive points of a trajectory in a single pass
+        using Welford's algorithm. The formulas used are the same as the ones in the
+        DistanceCalculator module.
+
+        Parameters
+        ----------
+            lat: numpy.ndarray
+                The latitudes of the trajectory points.
+            lon: numpy.ndarray
+                The longitudes of the trajectory points.
+
+        Returns
+        -------
+            tuple:
+                The (distance mean, distance std, bearing mean, bearing std) tuple.
+    """
+    d_n, d_mean, d_m2 = 0, 0.0, 0.0
+    b_n, b_mean, b_m2 = 0, 0.0, 0.0
+    for i in range(1, len(lat)):
+        lat1, lon1 = math.radians(lat[i - 1]), math.radians(lon[i - 1])
+        lat2, lon2 = math.radians(lat[i]), math.radians(lon[i])
+
+        # Haversine distance in metres.
+        val_one = math.sin((lat2 - lat1) / 2.0) ** 2 + \
+            math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2.0) ** 2
+        dist = const.RADIUS_OF_EARTH * 2 * math.atan2(np.sqrt(val_one), np.sqrt(1 - val_one)) * 1000
+
+        # Bearing in degrees.
+        y = math.cos(lat2) * math.sin(lon2 - lon1)
+        x = math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * math.cos(lat2) * math.cos(lon2 - lon1)
+        bearing = math.degrees(math.atan2(y, x)) % 360.0
+
+        if not np.isnan(dist):
+            d_n += 1
+            delta = dist - d_mean
+            d_mean += delta / d_n
+            d_m2 += delta * (dist - d_mean)
+
+        if not np.isnan(bearing):
+            b_n += 1
+            delta = bearing - b_mean
+            b_mean += delta / b_n
+            b_m2 += delta * (bearing - b_mean)
+
+    # Similar to pandas, the mean of no values and the (sample) standard deviation
+    # of less than 2 values are NaN.
+    d_mean = d_mean if d_n > 0 else np.nan
+    b_mean = b_mean if b_n > 0 else np.nan
+    d_std = np.sqrt(d_m2 / (d_n - 1)) if d_n > 1 else np.nan
+    b_std = np.sqrt(b_m2 / (b_n - 1)) if b_n > 1 else np.nan
+
+    return d_mean, d_std, b_mean, b_std
+
+
+@njit(cache=True)
+def _traj_dist_bearing_stats(offsets, lat, lon):
+    """
+        Calculate the mean and standard deviation of the distance and bearing between
+        the consecutive points of every trajectory of the dataset at once.
+
+        Parameters
+        ----------
+            offsets: numpy.ndarray
+                The offsets of the trajectories, the points of the i-th trajectory
+                being stored at offsets[i]:offsets[i + 1].
+            lat: numpy.ndarray
+                The latitudes of the points.
+            lon: numpy.ndarray
+                The longitudes of the points.
+
+        Returns
+        -------
+            numpy.ndarray:
+                The (4, number of trajectories) array containing the distance mean,
+                distance std, bearing mean and bearing std of the trajectories.
+    """
+    stats = np.empty((4, len(offsets) - 1))
+    for t in range(len(offsets) - 1):
+        d_mean, d_std, b_mean, b_std = _dist_bearing_stats(lat[offsets[t]:offsets[t + 1]],
+                                                           lon[offsets[t]:offsets[t + 1]])
+        stats[0, t] = d_mean
+        stats[1, t] = d_std
+        stats[2, t] = b_mean
+        stats[3, t] = b_std
+
+    return stats
+
+
+@njit(inline='always', fastmath=True, cache=True)
+def _pos(t, x1, v1, b, c):
+    """
+        Calculate the position at time t based on the kinematic equation
+        x1 + v1*t + b*t^2/2 + c*t^3/6 evaluated in the Horner form.
+    """
+    return x1 + t * (v1 + t * (b / 2 + t * c / 6))
+
+
+@njit(cache=True)
+def _cubic_spline_eval(x, y, x_new):
+    """
+        Create a cubic spline with not-a-knot end conditions through the given points
+        and evaluate it at the new points. The slopes of the spline at the points are
+        found by solving the tridiagonal system with the Thomas algorithm, the same
+        system as the one solved by Scipy's CubicSpline.
+
+        Parameters
+        ----------
+            x: numpy.ndarray
+                The strictly increasing x values of the points, at least 4 of them.
+            y: numpy.ndarray
+                The (len(x), k) array of the y values of the points.
+            x_new: numpy.ndarray
+                The x values at which the spline is to be evaluated.
+
+        Returns
+        -------
+            numpy.ndarray:
+                The (len(x_new), k) array of the values of the spline.
+    """
+    n = len(x)
+    dx = x[1:] - x[:-1]
+
+    # Create the tridiagonal system for the slopes with the not-a-knot conditions in
+    # the first and the last rows.
+    lower = np.zeros(n)
+    diag = np.empty(n)
+    upper = np.zeros(n)
+    diag[0] = dx[1]
+    upper[0] = x[2] - x[0]
+    for i in range(1, n - 1):
+        lower[i] = dx[i]
+        diag[i] = 2 * (dx[i - 1] + dx[i])
+        upper[i] = dx[i - 1]
+    lower[n - 1] = x[n - 1] - x[n - 3]
+    diag[n - 1] = dx[n - 3]
+
+    # Forward elimination of the matrix which is shared by all the columns of y.
+    c = np.empty(n)
+    m = np.empty(n)
+    m[0] = diag[0]
+    c[0] = upper[0] / m[0]
+    for i in range(1, n):
+        m[i] = diag[i] - lower[i] * c[i - 1]
+        c[i] = upper[i] / m[i]
+
+    out = np.empty((len(x_new), y.shape[1]))
+    slope = np.empty(n - 1)
+    b = np.empty(n)
+    s = np.empty(n)
+    for col in range(y.shape[1]):
+        for i in range(n - 1):
+            slope[i] = (y[i + 1, col] - y[i, col]) / dx[i]
+
+        d = x[2] - x[0]
+        b[0] = ((dx[0] + 2 * d) * dx[1] * slope[0] + dx[0] ** 2 * slope[1]) / d
+        for i in range(1, n - 1):
+            b[i] = 3 * (dx[i] * slope[i - 1] + dx[i - 1] * slope[i])
+        d = x[n - 1] - x[n - 3]
+        b[n - 1] = (dx[n - 2] ** 2 * slope[n - 3] + (2 * d + dx[n - 2]) * dx[n - 3] * slope[n - 2]) / d
+
+        # Solve for the slopes.
+        s[0] = b[0] / m[0]
+        for i in range(1, n):
+            s[i] = (b[i] - lower[i] * s[i - 1]) / m[i]
+        for i in range(n - 2, -1, -1):
+            s[i] -= c[i] * s[i + 1]
+
+        # Evaluate the cubic polynomial of the interval containing every new point in
+        # the Horner form, the points outside of the range are extrapolated.
+        for j in range(len(x_new)):
+            i = min(max(np.searchsorted(x, x_new[j], side='right') - 1, 0), n - 2)
+            t = (s[i] + s[i + 1] - 2 * slope[i]) / dx[i]
+            c0 = t / dx[i]
+            c1 = (slope[i] - s[i]) / dx[i] - t
+            h = x_new[j] - x[i]
+            out[j, col] = ((c0 * h + c1) * h + s[i]) * h + y[i, col]
+
+    return out
+
+
+@njit(cache=True)
+def _kinematic_core(time_deltas, gaps, lat, lon, lat_velocity, lon_velocity, new_times):
+    """
+        Calculate the kinematically interpolated positions of all the points after which
+        the time difference to the next point exceeds the sampling rate.
+
+        Parameters
+        ----------
+            time_deltas: numpy.ndarray
+                The time difference (in seconds) between the consecutive points.
+            gaps: numpy.ndarray
+                The boolean mask of the points whose time difference to the previous
+                point is greater than the sampling rate.
+            lat: numpy.ndarray
+                The latitudes of the trajectory points.
+            lon: numpy.ndarray
+                The longitudes of the trajectory points.
+            lat_velocity: numpy.ndarray
+                The velocity along the latitude between the consecutive points.
+            lon_velocity: numpy.ndarray
+                The velocity along the longitude between the consecutive points.
+            new_times: numpy.ndarray
+                The scaled times at which the positions are to be interpolated.
+
+        Returns
+        -------
+            tuple:
+                The boolean mask of the points at which a gap starts, and the interpolated
+                latitudes and longitudes at those points.
+    """
+    n = len(time_deltas)
+    mask = np.zeros(n, dtype=np.bool_)
+    ip_lat = np.empty(n)
+    ip_lon = np.empty(n)
+    for i in range(1, n):
+        dt_ = time_deltas[i]
+        if gaps[i] and not np.isnan(lat_velocity[i - 1]):
+            # Solve the 2x2 system [[dt^2/2, dt^3/6], [dt, dt^2/2]] * [b, c] = rhs
+            # for both the coordinates using Cramer's rule.
+            a00 = (dt_ ** 2) / 2
+            a01 = (dt_ ** 3) / 6
+            det = a00 * a00 - a01 * dt_
+
+            bx0 = lat[i] - lat[i - 1] - lat_velocity[i - 1] * dt_
+            bx1 = lat_velocity[i] - lat_velocity[i - 1]
+            by0 = lon[i] - lon[i - 1] - lon_velocity[i - 1] * dt_
+            by1 = lon_velocity[i] - lon_velocity[i - 1]
+
+            mask[i - 1] = True
+            ip_lat[i - 1] = _pos(new_times[i - 1], lat[i - 1], lat_velocity[i - 1],
+                                 (bx0 * a00 - a01 * bx1) / det, (a00 * bx1 - dt_ * bx0) / det)
+            ip_lon[i - 1] = _pos(new_times[i - 1], lon[i - 1], lon_velocity[i - 1],
+                                 (by0 * a00 - a01 * by1) / det, (a00 * by1 - dt_ * by0) / det)
+
+    return mask, ip_lat, ip_lon
+
+
+@njit(cache=True)
+def _sorted_replace(buf, old, new):
+    """
+        Replace a value in a sorted array with a new value while keeping the
+        array sorted.
+
+        Parameters
+        ----------
+            buf: numpy.ndarray
+                The sorted array containing the old value.
+            old: float
+                The value that is to be removed.
+            new: float
+                The value that is to be inserted.
+    """
+    n = len(buf)
+    j = np.searchsorted(buf, old)
+    for t in range(j, n - 1):
+        buf[t] = buf[t + 1]
+
+    k = np.searchsorted(buf[:n - 1], new)
+    for t in range(n - 1, k, -1):
+        buf[t] = buf[t - 1]
+    buf[k] = new
+
+
+@njit(cache=True)
+def _hampel_mask(x, window_size=5, n_sigmas=3):
+    """
+        Detect the outliers in the given array using the Hampel filter. The
+        rolling median and median absolute deviation are calculated over a
+        centered window of 2 * window_size points the same way as done by the
+        Hampel package, i.e. the windows containing NaN values are left out and
+        the values at both the ends are back and forward filled.
+
+        Parameters
+        ----------
+            x: numpy.ndarray
+                The values in which the outliers are to be detected.
+            window_size: int
+                Half of the size of the rolling window.
+            n_sigmas: int
+                The number of standard deviations away from the rolling median
+                after which a point is considered to be an outlier.
+
+        Returns
+        -------
+            numpy.ndarray
+                The boolean mask with True values at the outlier positions.
+
+        References
+        ----------
+            Pedrido, M.O., "Hampel", (2020), GitHub repository,
+            https://github.com/MichaelisTrofficus/hampel_filter
+    """
+    n = len(x)
+    window = 2 * window_size
+    median = np.full(n, np.nan)
+    sigma = np.full(n, np.nan)
+
+    # Calculate the rolling median and the scaled median absolute deviation. The
+    # value at position i is calculated using the window x[i - window_size: i + window_size].
+    # Instead of sorting every window, a sorted copy of the window is kept and updated
+    # by removing the value leaving the window and inserting the one entering it.
+    buf = np.empty(window)
+    valid = False
+    nan_count = 0
+    for i in range(window_size, n - window_size + 1):
+        lo, hi = i - window_size, i + window_size
+        if i == window_size:
+            nan_count = np.isnan(x[lo:hi]).sum()
+        else:
+            nan_count += np.isnan(x[hi - 1]) - np.isnan(x[lo - 1])
+        if nan_count > 0:
+            valid = False
+            continue
+
+        if valid:
+            _sorted_replace(buf, x[lo - 1], x[hi - 1])
+        else:
+            buf[:] = np.sort(x[lo:hi])
+            valid = True
+
+        # The window always has an even length, so the median is the mean of the 2
+        # middle values.
+        med = 0.5 * (buf[window_size - 1] + buf[window_size])
+        median[i] = med
+
+        # The deviations from the median grow in both directions away from the middle
+        # of the sorted window, hence the 2 middle deviations are found by merging
+        # both the sides until window_size + 1 of them are seen.
+        left, right = window_size - 1, window_size
+        prev, cur = 0.0, 0.0
+        for _ in range(window_size + 1):
+            if right >= window or (left >= 0 and med - buf[left] <= buf[right] - med):
+                dev = med - buf[left]
+                left -= 1
+            else:
+                dev = buf[right] - med
+                right += 1
+            prev, cur = cur, dev
+        sigma[i] = 1.4826 * (0.5 * (prev + cur))
+
+    # Back fill and then forward fill the values at the positions where the
+    # window was incomplete.
+    for i in range(n - 2, -1, -1):
+        if np.isnan(median[i]):
+            median[i] = median[i + 1]
+            sigma[i] = sigma[i + 1]
+    for i in range(1, n):
+        if np.isnan(median[i]):
+            median[i] = median[i - 1]
+            sigma[i] = sigma[i - 1]
+
+    # Comparisons involving NaN values are False, so those points are never outliers.
+    return np.abs(x - median) >= n_sigmas * sigma
+
 
 class Helpers:
     # ------------------------------------ Interpolation Helpers --------------------------------------- #
     @staticmethod
-    def linear_help(dataframe: Union[pd.DataFrame, PTRAILDataFrame],
-                    id_: Text, sampling_rate: float, class_label_col):
+    def hampel_help(df, column_name):
         """
-            This method takes a dataframe and uses linear interpolation to determine coordinates
-            of location on Datetime where the time difference between 2 consecutive points exceeds
-            the user-specified sampling_rate and inserts the interpolated point those between 2 points.
+            This function is the helper function for the hampel_outlier_detection()
+            function present in the filters module. The purpose of the function is to
+            run the hampel filter on a single trajectory ID, remove the outliers
+            and return the smaller dataframe.
+
+            Warning
+            -------
+                This function should not be used directly as it will result in a
+                slower execution of the function and might result in removal of
+                points that are actually not outliers.
 
             Warning
             -------
-                This method should not be used for dataframes with multiple trajectory ids as it will
-                yield wrong results and there might be a significant drop in performance.
+                Do not use Hampel filter outlier detection and try to detect outliers
+                with DateTime as it will raise a NotImplementedError as it has not been
+                implemented yet by the original author of the Hampel filter.
 
             Parameters
             ----------
-                dataframe: Union[pd.DataFrame, NumTrajDF]
-                     The dataframe containing the original trajectory data.
-                id_: Text
-                    The Trajectory ID of the points in the dataframe.
-                sampling_rate: float
-                    The maximum time difference between 2 points greater than which
-                    a point will be inserted between 2 points.
+                df: PTRAILDataFrame/pd.core.dataframe.DataFrame
+                    The dataframe which the outliers are to be removed
+                column_name: Text
+                    The column based on which the outliers are to be removed.
 
             Returns
             -------
-                pandas.core.dataframe.DataFrame
-                    The dataframe containing the trajectory enhanced with interpolated
-                    points.
+                pd.core.dataframe.DataFrame
+                    The dataframe where the outlier points are removed.
 
         """
-        # Now, for each unique ID in the dataframe, interpolate the points.
-        # Create a Series containing new times which are calculated as follows:
-        #    new_time[i] = original_time[i] + sampling_rate.
-        new_times = dataframe.reset_index()[const.DateTime] + pd.to_timedelta(sampling_rate, unit='seconds')
-
-        # Now, interpolate the latitudes using numpy based on the new times calculated above.
-        ip_lat = np.interp(new_times,
-                           dataframe.reset_index()[const.DateTime],
-                           dataframe.reset_index()[const.LAT])
-
-        # Now, interpolate the longitudes using numpy based on the new times calculated above.
-        ip_long = np.interp(new_times,
-                            dataframe.reset_index()[const.DateTime],
-                            dataframe.reset_index()[const.LONG])
-
-        # Here, store the time difference between all the consecutive points in an array.
-        time_deltas = dataframe.reset_index()[const.DateTime].diff().dt.total_seconds()
-
-        # Now, for each point in the trajectory, check whether the time difference between
-        # 2 consecutive points is greater than the user-specified sampling_rate, and if so then
-        # insert a new point that is linearly interpolated between the 2 original points.
-        for j in range(len(time_deltas)):
-            if time_deltas[j] > sampling_rate:
-                if class_label_col == '':
-                    dataframe.loc[new_times[j - 1]] = [id_, ip_lat[j - 1], ip_long[j - 1]]
-                else:
-                    dataframe.loc[new_times[j - 1]] = [id_, ip_lat[j - 1], ip_long[j - 1],
-                                                       dataframe[class_label_col].iloc[0]]
-
-        return dataframe
+        try:
+            # First, extract the column from the dataframe as an array and then obtain
+            # the outlier indices which are to be removed.
+            col = df[column_name].to_numpy(dtype=np.float64)
+            outlier_indices = np.flatnonzero(_hampel_mask(col))
+
+            # Now, drop the indices given out by the hampel filter.
+            to_return = df.drop(df.index[outlier_indices])
+            #
+
+            return to_return
+
+        except KeyError:
+            raise MissingColumnsException(f"The column {column_name} does not exist in the dataset."
+                                          f"Please check the column name and try again.")
 
     @staticmethod
-    def cubic_help(df: Union[pd.DataFrame, PTRAILDataFrame], id_: Text,
-                   sampling_rate: float, class_label_col):
+    def _cubic_points(times, lat, lon, sampling_rate: float):
         """
-            This method takes a dataframe and uses cubic interpolation to determine coordinates
-            of location on Datetime where the time difference between 2 consecutive points exceeds
-            the user-specified sampling_rate and inserts the interpolated point those between 2 points.
-
-            Warning
-            -------
-                This method should not be used for dataframes with multiple trajectory ids as it will
-                yield wrong results and there might be a significant drop in performance.
+            Calculate the cubic-spline interpolated points of a single trajectory
+            stored as plain arrays of timestamps, latitudes and longitudes.
 
             Parameters
             ----------
-                df: Union[pd.DataFrame, NumTrajDF]
-                     The dataframe containing the original trajectory data.
-                id_: Text
-                    The Trajectory ID of the points in the dataframe.
+                times: numpy.ndarray
+                    The int64 nanosecond timestamps of the points.
+                lat: numpy.ndarray
+                    The latitudes of the points.
+                lon: numpy.ndarray
+                    The longitudes of the points.
                 sampling_rate: float
                     The maximum time difference between 2 points greater than which
                     a point will be inserted between 2 points.
 
             Returns
             -------
-                pandas.core.dataframe.DataFrame
-                    The dataframe containing the trajectory enhanced with interpolated
-                    points.
+                tuple:
+                    The int64 nanosecond timestamps, latitudes and longitudes of the
+                    new points.
         """
-        # Create a Series containing new times which are calculated as follows:
+        empty = (np.empty(0, dtype=np.int64), np.empty(0), np.empty(0))
+
+        # If the trajectory has 3 or less points, then skip the trajectory from the
+        # interpolation as a cubic spline cannot be created.
+        if len(times) <= 3:
+            return empty
+
+        # Find all the points after which the time difference to the next point is greater
+        # than the user-specified sampling_rate and calculate the times of the new points as
+        # follows:
         #    new_time[i] = original_time[i] + sampling_rate.
-        new_times = df.reset_index()[const.DateTime] + pd.to_timedelta(sampling_rate, unit='seconds')
-
-        # Now, using Scipy's Cubic spline, create a spline object for interpolation of
-        # points for the dataframes which have a length greater than 3 else CubicSpline
-        # doesn't execute.
-        if len(df) > 3:
-            # Create the x and y values for the CubicSpline function.
-            # We make sure that there is a strictly increasing sequence of points.
-            x = df.reset_index()[const.DateTime].sort_values().drop_duplicates()
-            y = df.reset_index().iloc[x.index][[const.LAT, const.LONG]].to_numpy()
-
-            cubic_spline = CubicSpline(x=x, y=y, extrapolate=True, bc_type='not-a-knot')
-            # Now, calculate the interpolated position of the points at all the new_times
-            #    calculated above.
-            ip_coords = cubic_spline(new_times)
-
-        # Here, store the time difference between all the consecutive points in an array.
-        time_deltas = df.reset_index()[const.DateTime].diff().dt.total_seconds()
-
-        # Now, for each point in the trajectory, check whether the time difference between
-        # 2 consecutive points is greater than the user-specified sampling_rate, and if so then
-        # insert a new point that is cubic-spline interpolated between the 2 original points.
-        for j in range(len(time_deltas)):
-            # If the trajectory has less than 3 points, then skip the trajectory
-            # from the interpolation.
-            if len(df) > 3:
-                if time_deltas[j] > sampling_rate:
-                    if class_label_col == '':
-                        df.loc[new_times[j - 1]] = [id_, ip_coords[j - 1][0], ip_coords[j - 1][1]]
-                    else:
-                        df.loc[new_times[j - 1]] = [id_, ip_coords[j - 1][0], ip_coords[j - 1][1],
-                                                    df[class_label_col].iloc[0]]
-
-        return df
+        offset = round(sampling_rate * 1e9)
+        gaps = np.flatnonzero(times[1:] - times[:-1] > offset)
+        new_times = times[gaps] + offset
+        if len(new_times) == 0:
+            return empty
+
+        # Now, using the numba kernel, create a cubic spline with not-a-knot end conditions
+        # for the interpolation of the points. A single spline covers both the latitudes
+        # and longitudes. The x values for the spline are the float values of the int64 view
+        # of the timestamps. We make sure that there is a strictly increasing sequence of points,
+        # however, the sorting is only done when the trajectory is not already sorted by time,
+        # which is almost never the case.
+        x = times
+        y = np.column_stack((lat, lon))
+        if not np.all(x[1:] > x[:-1]):
+            x, first = np.unique(x, return_index=True)
+            y = y[first]
+
+            # Skip the trajectory if it is left with 3 or less distinct timestamps.
+            if len(x) <= 3:
+                return empty
+
+        # Evaluate the spline only at the times of the new points calculated above.
+        ip_coords = _cubic_spline_eval(x.astype(np.float64), y, new_times.astype(np.float64))
+        return new_times, ip_coords[:, 0], ip_coords[:, 1]
 
     @staticmethod
-    def random_walk_help(dataframe: PTRAILDataFrame, id_: Text,
-                         sampling_rate: float, class_label_col):
+    def _kinematic_points(times, lat, lon, sampling_rate: float):
         """
-            This method takes a dataframe and uses random-walk interpolation to determine coordinates
-            of location on Datetime where the time difference between 2 consecutive points exceeds
-            the user-specified sampling_rate and inserts the interpolated point those between 2 points.
-
-            Warning
-            -------
-                This method should not be used for dataframes with multiple trajectory ids as it will
-                yield wrong results and there might be a significant drop in performance.
+            Calculate the kinematic interpolated points of a single trajectory
+            stored as plain arrays of timestamps, latitudes and longitudes.
 
             Parameters
             ----------
-                dataframe: Union[pd.DataFrame, NumTrajDF]
-                     The dataframe containing the original trajectory data.
-                id_: Text
-                    The Trajectory ID of the points in the dataframe.
+                times: numpy.ndarray
+                    The int64 nanosecond timestamps of the points.
+                lat: numpy.ndarray
+                    The latitudes of the points.
+                lon: numpy.ndarray
+                    The longitudes of the points.
                 sampling_rate: float
                     The maximum time difference between 2 points greater than which
                     a point will be inserted between 2 points.
 
             Returns
             -------
-                pandas.core.dataframe.DataFrame
-                    The dataframe containing the trajectory enhanced with interpolated
-                    points.
-
-            References
-            ----------
-                Etemad, M., Soares, A., Etemad, E. et al. SWS: an unsupervised trajectory
-                segmentation algorithm based on change detection with interpolation kernels.
-                Geoinformatica (2020)
+                tuple:
+                    The int64 nanosecond timestamps, latitudes and longitudes of the
+                    new points.
         """
-        # Create a Series containing new times which are calculated as follows:
+        # Create an array containing new times which are calculated as follows:
         #    new_time[i] = original_time[i] + sampling_rate.
-        new_times = dataframe.reset_index()[const.DateTime] + pd.to_timedelta(sampling_rate, unit='seconds')
-
-        # First, create a distance between the consecutive points of the dataframe,
-        # then, calculate the mean and standard deviation of all the distances between
-        # consecutive points.
-        df1 = spatial.create_distance_column(dataframe)
-        d_mean = (df1['Distance'].mean(skipna=True))
-        d_std = (df1['Distance'].std(skipna=True))
-
-        # Now, create a bearing between the consecutive points of the dataframe,
-        # then, calculate the mean and standard deviation of all the bearings between
-        # consecutive points.
-        df = spatial.create_bearing_column(df1)
-        b_mean = df['Bearing'].mean(skipna=True)
-        b_std = df['Bearing'].std(skipna=True)
-
-        calc_a = np.random.normal(d_mean, d_std, 1) / 1000
-        calc_b = np.radians(np.random.normal(b_mean, b_std, 1))
-
-        # print(f"Calc: {calc_a, calc_b}")
-        # if d_std == 0 or b_std == 0:
-        #     return dataframe
-        #
-        # # Here, using Scipy's truncnorm() function, create an object that gives out random
-        # # values. It is to be noted that the values are restricted between latitude.min()
-        # # and latitude.max().
-        # d_mean = truncnorm((df1['lat'].min() - d_mean) / d_std,
-        #                    (df1['lat'].max() - d_mean) / d_std,
-        #                    loc=d_mean,
-        #                    scale=d_std)
-        #
-        # # Here, using Scipy's truncnorm() function, create an object that gives out random
-        # # values. It is to be noted that the values are restricted between longitude.min()
-        # # and longitude.max().
-        # b_mean = truncnorm((df['lon'].min() - b_mean) / b_std,
-        #                    (df['lon'].max() - b_mean) / b_std,
-        #                    loc=b_mean,
-        #                    scale=b_std)
-        #
-        # # Using the 2 objects created above, generate a random value from them. The value
-        # # is selected randomly from a uniformly distributed sample
-        # calc_a = d_mean.rvs()
-        # calc_b = math.radians(b_mean.rvs())
-
-        dy = calc_a * np.cos(calc_b)
-        dx = calc_a * np.sin(calc_b)
-
-        # Here, store the time difference between all the consecutive points in an array.
-        time_deltas = df.reset_index()[const.DateTime].diff().dt.total_seconds()
-
-        # Look for a time diff that exceeds the sampling_rate and if one is found, calculate the
-        # latitude and longitude and then append them to the dataframe at the location where
-        # the threshold is crossed.
-        for i in range(len(time_deltas)):
-            if len(df) > 3:
-                if time_deltas[i] > sampling_rate:
-                    new_lat = df[const.LAT].iloc[i - 1] + (dy / const.RADIUS_OF_EARTH) * (180 / np.pi)
-                    new_lon = df[const.LONG].iloc[i - 1] +\
-                              (dx / const.RADIUS_OF_EARTH) * (180 / np.pi) / np.cos(df[const.LAT].iloc[i - 1] * np.pi / 180)
-                    if class_label_col == '':
-                        dataframe.loc[new_times[i - 1]] = [id_, new_lat[0], new_lon[0]]
-                    else:
-                        dataframe.loc[new_times[i - 1]] = [id_, new_lat[0], new_lon[0],
-                                                           dataframe[class_label_col].iloc[0]]
-
-
-        # Return the new dataframe
-        return dataframe
+        offset = round(sampling_rate * 1e9)
+        new_times = times + offset
+
+        # Here, store the time difference between all the consecutive points in seconds,
+        # the first point having no previous point gets NaN.
+        seconds = np.empty(len(times), dtype=np.float64)
+        seconds[:1] = np.nan
+        seconds[1:] = (times[1:] - times[:-1]) / 1e9
+        gaps = np.zeros(len(times), dtype=np.bool_)
+        gaps[1:] = times[1:] - times[:-1] > offset
+
+        # Points recorded at the same time yield infinite velocities, same as pandas,
+        # hence the division warnings are suppressed.
+        with np.errstate(divide='ignore', invalid='ignore'):
+            lat_velocity = np.diff(lat, prepend=np.nan) / seconds
+            lon_velocity = np.diff(lon, prepend=np.nan) / seconds
+
+        # Look for a time diff that exceeds the sampling_rate and if one is found, calculate
+        # the latitude and longitude using the numba kernel.
+        mask, ip_lat, ip_lon = _kinematic_core(seconds, gaps, lat, lon, lat_velocity, lon_velocity,
+                                               (new_times / 1e9) / 10e9)
+        return Helpers._drop_colliding(times, new_times[mask], ip_lat[mask], ip_lon[mask])
 
     @staticmethod
-    def kinematic_help(dataframe: Union[pd.DataFrame, PTRAILDataFrame], id_: Text,
-                       sampling_rate: float, class_label_col):
+    def _drop_colliding(times, new_times, new_lat, new_lon):
         """
-            This method takes a dataframe and uses kinematic interpolation to determine coordinates
-            of location on Datetime where the time difference between 2 consecutive points exceeds
-            the user-specified sampling_rate and inserts the interpolated point those between 2 points.
-
-            Warning
-            -------
-                This method should not be used for dataframes with multiple trajectory ids as it will
-                yield wrong results and there might be a significant drop in performance.
+            Drop the new points whose timestamp is already taken in the trajectory.
+            The points used to be inserted with .loc on the DateTime index, which
+            overwrote the row of an existing timestamp instead of adding a new one.
 
             Parameters
             ----------
-                dataframe: Union[pd.DataFrame, NumTrajDF]
-                     The dataframe containing the original trajectory data.
-                id_: Text
-                    The Trajectory ID of the points in the dataframe.
-                sampling_rate: float
-                    The maximum time difference between 2 points greater than which
-                    a point will be inserted between 2 points.
+                times: numpy.ndarray
+                    The int64 nanosecond timestamps of the original points.
+                new_times: numpy.ndarray
+                    The int64 nanosecond timestamps of the new points.
+                new_lat: numpy.ndarray
+                    The latitudes of the new points.
+                new_lon: numpy.ndarray
+                    The longitudes of the new points.
 
             Returns
             -------
-                pandas.core.dataframe.DataFrame
-                    The dataframe containing the trajectory enhanced with interpolated
-                    points.
-
-            References
-            ----------
-                Nogueira, T.O., "kinematic_interpolation.py", (2016), GitHub repository,
-                https://gist.github.com/talespaiva/128980e3608f9bc5083b.js
+                tuple:
+                    The timestamps, latitudes and longitudes of the new points that
+                    are kept.
         """
-        # Create a Series containing new times which are calculated as follows:
-        #    new_time[i] = original_time[i] + sampling_rate.
-        new_times = dataframe.reset_index()[const.DateTime] + pd.to_timedelta(sampling_rate, unit='seconds')
-
-        # Here, store the time difference between all the consecutive points in an array.
-        time_deltas = dataframe.reset_index()[const.DateTime].diff().dt.total_seconds()
-        lat_diff = dataframe.reset_index()[const.LAT].diff()
-        lon_diff = dataframe.reset_index()[const.LONG].diff()
-
-        lat_velocity = lat_diff / time_deltas
-        lon_velocity = lon_diff / time_deltas
-
-        lat = list(dataframe.reset_index()[const.LAT].values)
-        lon = list(dataframe.reset_index()[const.LONG].values)
-
-        # Look for a time diff that exceeds the sampling_rate and if one is found, calculate the
-        # latitude and longitude and then append them to the dataframe at the location where
-        # the threshold is crossed.
-        for i in range(len(time_deltas)):
-            if time_deltas[i] > sampling_rate and not np.isnan(lat_velocity[i - 1]):
-                ax = np.array([[(time_deltas[i] ** 2) / 2, (time_deltas[i] ** 3) / 6],
-                               [float(time_deltas[i]), (time_deltas[i] ** 2) / 2]])
-                bx = [lat[i] - lat[i - 1] - lat_velocity[i - 1] * time_deltas[i], lat_velocity[i] - lat_velocity[i - 1]]
-                coef_x = np.linalg.solve(ax, bx)
-
-                ay = ax
-                by = [lon[i] - lon[i - 1] - lon_velocity[i - 1] * time_deltas[i], lon_velocity[i] - lon_velocity[i - 1]]
-                coef_y = np.linalg.solve(ay, by)
-
-                td = new_times[i - 1].timestamp() / 10e9
-                x = Helpers._pos(t=td, x1=lat[i - 1], v1=lat_velocity[i - 1], b=coef_x[0], c=coef_x[1])
-                y = Helpers._pos(t=td, x1=lon[i - 1], v1=lon_velocity[i - 1], b=coef_y[0], c=coef_y[1])
-
-                if class_label_col == '':
-                    dataframe.loc[new_times[i - 1]] = [id_, x, y]
-                else:
-                    dataframe.loc[new_times[i - 1]] = [id_, x, y, dataframe[class_label_col].iloc[0]]
-
-        return dataframe
+        # Of the new points sharing a timestamp, the last one is kept as it is the
+        # one that overwrote the others.
+        _, last = np.unique(new_times[::-1], return_index=True)
+        keep = np.zeros(len(new_times), dtype=np.bool_)
+        keep[len(new_times) - 1 - last] = True
+        keep &= ~np.isin(new_times, times)
+        return new_times[keep], new_lat[keep], new_lon[keep]
 
+    # ------------------------------------------ Statistics Helpers ----------------------------------- #
     @staticmethod
-    def hampel_help(df, column_name):
+    def _segment_indexed_traj(traj, num_days):
         """
-            This function is the helper function for the hampel_outlier_detection()
-            function present in the filters module. The purpose of the function is to
-            run the hampel filter on a single trajectory ID, remove the outliers
-            and return the smaller dataframe.
-
-            Warning
-            -------
-                This function should not be used directly as it will result in a
-                slower execution of the function and might result in removal of
-                points that are actually not outliers.
-
-            Warning
-            -------
-                Do not use Hampel filter outlier detection and try to detect outliers
-                with DateTime as it will raise a NotImplementedError as it has not been
-                implemented yet by the original author of the Hampel filter.
+            Segment a single trajectory indexed by [traj_id, DateTime] into smaller
+            segments wherein each segment contains the points of a span of num_days
+            days only. The segments are returned already indexed by
+            [traj_id, seg_id, DateTime], so no index needs to be rebuilt afterwards.
 
             Parameters
             ----------
-                df: PTRAILDataFrame/pd.core.dataframe.DataFrame
-                    The dataframe which the outliers are to be removed
-                column_name: Text
-                    The column based on which the outliers are to be removed.
+                traj: pandas.core.dataframe.DataFrame
+                    The dataframe containing the points of a single trajectory.
+                num_days: int
+                    The number of days that each segment is supposed to have.
 
             Returns
             -------
-                pd.core.dataframe.DataFrame
-                    The dataframe where the outlier points are removed.
-
+                pandas.core.dataframe.DataFrame:
+                    The dataframe containing the segments of the trajectory.
         """
-        try:
-            # First, extract the column from the dataframe and then obtain the
-            # outlier indices which are to be removed.
-            col = df[column_name]
-            outlier_indices = hampel(col)
-
-            # Now, drop the indices given out by the hampel filter.
-            to_return = df.drop(df.index[outlier_indices])
-            #
-
-            return to_return
-
-        except KeyError:
-            raise MissingColumnsException(f"The column {column_name} does not exist in the dataset."
-                                          f"Please check the column name and try again.")
-
-    @staticmethod
-    def _pos(t, x1, v1, b, c):
-        return x1 + v1 * t + (t ** 2) * b / 2 + (t ** 3) * c / 6
-
-    # ------------------------------------------ Statistics Helpers ----------------------------------- #
-    @staticmethod
-    def split_traj_helper(df, num_days):
-        # First, create the date column and get all the unique traj_ids
-        # in the dataframe.
-        df['Date'] = df[const.DateTime].dt.date
-        ids_ = list(df.traj_id.value_counts().keys())
-
-        df_chunks = []
-        for i in range(len(ids_)):
-            small_df = df.reset_index().loc[df.reset_index()[const.TRAJECTORY_ID] == ids_[i]]
-            df_chunks.append(small_df)
-
-        # Now, iterate over the entire dataframe and then segment
-        # the trajectories by num_days each.
-        results = []
-        for i in range(len(ids_)):
-            # Take the traj_df of a single Trajectory out from the
-            # list of chunks and find their max and min timestamps.
-            traj = df_chunks[i]
-            t_max = traj[const.DateTime].max()
-            t_min = traj[const.DateTime].min()
-
-            # For iteration purposes, set t_1 to min and t_2 to
-            # t_1 + num_days days.
-            t_1 = t_min
-            t_2 = t_1 + dt.timedelta(days=num_days)
-            seg_id = 1
-
-            # Now, segment the trajectories into smaller segments
-            # wherein each segment contains the points of a span
-            # of num_days days only.
-            while t_2 < t_max:
-                if t_2 < t_max:
-                    seg = Helpers.filt_df_by_date(traj,
-                                                  start_date=t_1.strftime('%Y-%m-%d'),
-                                                  end_date=t_max.strftime('%Y-%m-%d'))
-                    # Once filtered, assign the segment with a segment ID.
-                    seg['seg_id'] = seg_id
-
-                    # Increment the segment id, t_1 and t_2 values by
-                    # 1, num_days days each respectively to continue the iteration.
-                    t_1 += dt.timedelta(days=num_days)
-                    t_2 += dt.timedelta(days=num_days)
-
-                    if len(seg) > 0:
-                        seg_id += 1
-
-                    results.append(seg.drop(columns=['index', 'level_0']))
-
-                # If, t_2 is greater than the max time present in the
-                # trajectory, then assign t_2 = max and proceed
-                # further with segmentation.
-                elif t_2 >= t_max:
-                    seg = Helpers.filt_df_by_date(traj,
-                                                  start_date=t_1.strftime('%Y-%m-%d'),
-                                                  end_date=t_max.strftime('%Y-%m-%d'))
-                    # Once filtered, assign the segment with a segment ID.
-                    seg['seg_id'] = seg_id
-
-                    # Increment the segment id, t_1 and t_2 values by
-                    # 1, num_days each respectively to continue the iteration.
-                    t_1 += dt.timedelta(days=num_days)
-                    t_2 += dt.timedelta(days=num_days)
-
-                    if len(seg) > 0:
-                        seg_id += 1
-
-                    results.append(seg.drop(columns=['index', 'level_0']))
-                    seg_id += 1
-
-        # Finally, concat the dataframes, set the index as
+        # Find the max and min timestamps of the trajectory along with the date of
+        # each of its points.
+        times = traj.index.get_level_values(const.DateTime)
+        days = times.normalize().values
+        t_max = times.max()
+        t_1 = times.min()
+        step = dt.timedelta(days=num_days)
+
+        # Now, segment the trajectory by moving t_1 ahead num_days days at a time for as
+        # long as t_1 + num_days is before t_max. Every segment contains the points from
+        # the date of t_1 up to the date of t_max, and the segments left empty do not use
+        # up a seg_id. Only the positions of the points of each segment are collected.
+        positions, seg_ids = [], []
+        seg_id = 1
+        while t_1 + step < t_max:
+            pos = np.flatnonzero(days >= np.datetime64(t_1.normalize()))
+            positions.append(pos)
+            seg_ids.append(np.full(len(pos), seg_id))
+            if len(pos) > 0:
+                seg_id += 1
+            t_1 += step
+
+        # Finally, take the points of all the segments at once and index them by
         # [traj_id, seg_id, DateTime].
-        return pd.concat(results).reset_index().set_index(['traj_id', 'seg_id', 'DateTime']).sort_values(by=['traj_id',
-                                                                                                             'seg_id'])
+        pos = np.concatenate(positions) if positions else np.empty(0, dtype=np.int64)
+        seg = traj.take(pos)
+        seg.index = pd.MultiIndex.from_arrays(
+            [seg.index.get_level_values(const.TRAJECTORY_ID),
+             np.concatenate(seg_ids) if seg_ids else np.empty(0, dtype=np.int64),
+             seg.index.get_level_values(const.DateTime)],
+            names=[const.TRAJECTORY_ID, 'seg_id', const.DateTime])
+        seg['Date'] = seg.index.get_level_values(const.DateTime).date
+        return seg
 
     @staticmethod
-    def filt_df_by_date(dataframe, start_date, end_date):
-        # Convert the user-given string dates to pandas datetime format.
-        start_date = pd.to_datetime(start_date) if start_date is not None else None
-        end_date = pd.to_datetime(end_date) if end_date is not None else None
-
-        # Case-1: No start and end date are give. Hence just return the original dataframe.
-        if start_date is None and end_date is None:
-            filtered_df = dataframe
-
-        # Case-2: No start_date is given. Hence, return all the points upto and including
-        #         the points on the end date.
-        elif start_date is None and end_date is not None:
-            filt = dataframe['Date'] <= end_date
-            filtered_df = dataframe.loc[filt]
-
-        # Case-3: No end date is given. Hence, return all the point after and including the
-        #         points on the start date.
-        elif start_date is not None and end_date is None:
-            filt = dataframe['Date'] >= start_date
-            filtered_df = dataframe.loc[filt]
-
-        # Case-4: Both the start date and end date are given. Hence, return the points between
-        #         and including the points on start and end date.
-        else:
-            if end_date < start_date:
-                raise ValueError(f"End Date should be later than Start Date.")
-            else:
-                filt = np.logical_and(dataframe['Date'] >= start_date, dataframe['Date'] <= end_date)
-                filtered_df = dataframe.loc[filt].reset_index()
-
-        # Convert the smaller dataframe back to PTRAILDataFrame and return it.
-        return filtered_df
-
-    @staticmethod
-    def stats_helper(df, target_col_name, segmented):
+    def stats_helper_many(df, target_col_name, segmented):
         """
-            Generate the stats of the kinematic features present in the Dataframe.
+            Generate the stats of the kinematic features of all the trajectories
+            (or segments) present in the dataframe at once. The stats are calculated
+            with a handful of groupby aggregations instead of one describe() call
+            per trajectory.
 
             Parameters
             ----------
@@ -528,49 +679,72 @@ class Helpers:
             Returns
             -------
                 pd.core.dataframe.DataFrame:
-                    A dataframe containing the stats of the given trajectory.
-
+                    A dataframe containing the stats of all the trajectories. It is indexed
+                    by [traj_id, Columns], or [traj_id, seg_id, Columns] if segmented, where
+                    Columns is the name of the kinematic feature. Its columns are mean, std,
+                    min, 10%, 25%, 50%, 75%, 90% and max followed by the target column.
         """
-        # Grab the columns that we need.
-        if not segmented:
-            new_df = df.reset_index()[['traj_id', 'Distance', 'Distance_from_start', 'Speed',
-                                       'Acceleration', 'Jerk', 'Bearing', 'Bearing_Rate',
-                                       'Rate_of_bearing_rate']]
-            # Generate the stats along with the needed percentiles and arrange the dataframe
-            # properly.
-            stats = new_df.reset_index(drop=True).describe(percentiles=[0.1, 0.25, 0.5, 0.75, 0.9]).transpose()
-
-            # Assign the traj_id column.
-            stats['traj_id'] = new_df['traj_id'].iloc[0]
-            stats = stats[['traj_id', 'mean', 'std', 'min', '10%',
-                           '25%', '50%', '75%', '90%', 'max']]
-            stats[target_col_name] = df[target_col_name].iloc[0]
-
-            return stats.reset_index().rename(
-                columns={'index': 'Columns'}).reset_index(drop=True).set_index(['traj_id', 'Columns'])
-        else:
-            seg_id = df['seg_id'].iloc[0]
-            new_df = df.reset_index()[['traj_id', 'Distance', 'Distance_from_start', 'Speed',
-                                       'Acceleration', 'Jerk', 'Bearing', 'Bearing_Rate',
-                                       'Rate_of_bearing_rate']]
-
-            # Generate the stats along with the needed percentiles and arrange the dataframe
-            # properly.
-            stats = new_df.reset_index(drop=True).describe(percentiles=[0.1, 0.25, 0.5, 0.75, 0.9]).transpose()
-
-            # Assign the traj_id column.
-            stats['traj_id'] = new_df['traj_id'].iloc[0]
-            stats['seg_id'] = seg_id
-            stats = stats[['traj_id', 'seg_id', 'mean', 'std', 'min', '10%',
-                           '25%', '50%', '75%', '90%', 'max']]
-            stats[target_col_name] = df[target_col_name].iloc[0]
-            stats = stats.loc[:, ~stats.columns.duplicated()]
-
-            to_return = stats.reset_index().rename(
-                columns={'index': 'Columns'}).reset_index(drop=True).set_index(['traj_id', 'seg_id', 'Columns'])
-            return to_return
+        keys = ['traj_id', 'seg_id'] if segmented else ['traj_id']
+        cols = ['Distance', 'Distance_from_start', 'Speed', 'Acceleration', 'Jerk',
+                'Bearing', 'Bearing_Rate', 'Rate_of_bearing_rate']
+
+        new_df = df.reset_index()
+        grouped = new_df.groupby(keys, sort=False)[cols]
+
+        # Calculate each of the stats for all the groups at once, in the same order
+        # as the columns of a describe() output.
+        parts = {'mean': grouped.mean(), 'std': grouped.std(), 'min': grouped.min()}
+        for pct in [0.1, 0.25, 0.5, 0.75, 0.9]:
+            parts[f'{round(pct * 100)}%'] = grouped.quantile(pct)
+        parts['max'] = grouped.max()
+
+        # Convert each of the stats to a column with one row per feature of each group
+        # and assign the target value of each group.
+        stats = pd.concat({name: part.stack(dropna=False) for name, part in parts.items()}, axis=1)
+        stats.index = stats.index.set_names(keys + ['Columns'])
+        targets = new_df.drop_duplicates(subset=keys).set_index(keys)[target_col_name]
+        stats[target_col_name] = targets.reindex(stats.index.droplevel('Columns')).values
+
+        return stats
 
     # -------------------------------------- General Utilities ---------------------------------- #
+    @staticmethod
+    def _get_pool():
+        """
+            Get the pool of processes shared by the preprocessing modules. The pool is
+            created the first time it is requested and is reused afterwards so that the
+            cost of forking the worker processes is only paid once per session.
+
+            Note
+            ----
+                Same as elsewhere in the library, 2/3rds number of processes as there are
+                in the system are created. Some CPUs are kept free at all times in order
+                to not block up the system.
+
+            Returns
+            -------
+                multiprocessing.pool.Pool:
+                    The shared pool of processes.
+        """
+        global _POOL, _POOL_PID
+        if _POOL is None or _POOL_PID != os.getpid():
+            _POOL = multiprocessing.Pool(NUM_CPU)
+            _POOL_PID = os.getpid()
+            atexit.register(Helpers._close_pool)
+        return _POOL
+
+    @staticmethod
+    def _close_pool():
+        """
+            Close the shared pool of processes, if any, and wait for its
+            worker processes to exit.
+        """
+        global _POOL, _POOL_PID
+        if _POOL is not None and _POOL_PID == os.getpid():
+            _POOL.close()
+            _POOL.join()
+        _POOL, _POOL_PID = None, None
+
     @staticmethod
     def _get_partition_size(size):
         """
@@ -587,11 +761,6 @@ class Helpers:
                 int
                     The factor by which the datasets are to be split.
         """
-        # Based on the Operating system, get the number of CPUs available for
-        # multiprocessing.
-        num = os.cpu_count()
-        NUM_CPU = math.ceil((num * 2) / 3)
-
         # Integer divide the total number of Trajectory IDs by the number of available CPUs
         # The factor of 1 is added to avoid errors when the integer division yields a 0.
         factor = (size // NUM_CPU) + 1
@@ -624,7 +793,9 @@ class Helpers:
         """
         # First, create a list containing all the ids of the data and then further divide that
         # list items and split it into sub-lists of ids equal to split_factor.
-        ids_ = list(dataframe.reset_index().traj_id.value_counts().keys())
+        # The dataframe is expected to have the trajectory IDs as a column already,
+        # so it does not need to be copied by a reset_index() to list them.
+        ids_ = list(pd.unique(dataframe[const.TRAJECTORY_ID].values))
 
         # Get the ideal number of IDs by which the dataframe is to be split.
         split_factor = Helpers._get_partition_size(len(ids_))
@@ -632,7 +803,10 @@ class Helpers:
 
         # Now split the dataframes based on set of Trajectory ids.
         # As of now, each smaller chunk is supposed to have data of 100
-        # trajectory IDs max
-        df_chunks = [dataframe.loc[dataframe[const.TRAJECTORY_ID].isin(ids_[i])]
-                     for i in range(len(ids_))]
+        # trajectory IDs max. In order to avoid scanning the entire dataframe
+        # once per chunk, map each ID to the number of its chunk and then
+        # group the dataframe by the chunk numbers in a single pass.
+        chunk_nums = {traj_id: i for i in range(len(ids_)) for traj_id in ids_[i]}
+        codes = dataframe[const.TRAJECTORY_ID].map(chunk_nums).to_numpy()
+        df_chunks = [chunk for _, chunk in dataframe.groupby(codes, sort=True)]
         return df_chunks
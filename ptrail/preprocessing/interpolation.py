@@ -10,21 +10,17 @@
 
 """
 import itertools
-import multiprocessing as mlp
-import os
-from math import ceil
+from multiprocessing import shared_memory
 from typing import Optional, Text, Union
 
+import numpy as np
 import pandas
 import pandas as pd
 
 from ptrail.core.TrajectoryDF import PTRAILDataFrame as NumTrajDF
-from ptrail.preprocessing.helpers import Helpers as helper
+from ptrail.preprocessing.helpers import Helpers as helper, _traj_dist_bearing_stats
 from ptrail.utilities import constants as const
 
-num = os.cpu_count()
-NUM_CPU = ceil((num * 2) / 3)
-
 
 class Interpolation:
     @staticmethod
@@ -78,79 +74,35 @@ class Interpolation:
                 PTRAILDataFrame:
                     The dataframe containing the interpolated trajectory points.
         """
-        # First, lets split the dataframe into smaller chunks containing
-        # points of only n trajectory per chunk. n is
-        df = dataframe.reset_index()
-        df_chunks = helper._df_split_helper(df)
-
-        # Create a pool of processes which has number of processes
-        # equal to the number of unique dataframe partitions.
-        processes = [None] * len(df_chunks)
-        manager = mlp.Manager()
-        return_list = manager.list()
-
-        ip_type = ip_type.lower().strip()
-        if ip_type == 'linear':
-            for i in range(len(processes)):
-                processes[i] = mlp.Process(target=Interpolation._linear_ip,
-                                           args=(df_chunks[i], sampling_rate, return_list, class_label_col))
-                processes[i].start()
-
-            for j in range(len(processes)):
-                processes[j].join()
-
-        elif ip_type == 'cubic':
-            for i in range(len(processes)):
-                processes[i] = mlp.Process(target=Interpolation._cubic_ip,
-                                           args=(df_chunks[i], sampling_rate, return_list, class_label_col))
-                processes[i].start()
-
-            for j in range(len(processes)):
-                processes[j].join()
-        elif ip_type == 'kinematic':
-            for i in range(len(processes)):
-                processes[i] = mlp.Process(target=Interpolation._kinematic_ip,
-                                           args=(df_chunks[i], sampling_rate, return_list, class_label_col))
-                processes[i].start()
-
-            for j in range(len(processes)):
-                processes[j].join()
-        elif ip_type == 'random-walk':
-            for i in range(len(processes)):
-                processes[i] = mlp.Process(target=Interpolation._random_walk_ip,
-                                           args=(df_chunks[i], sampling_rate, return_list, class_label_col))
-                processes[i].start()
-
-            for j in range(len(processes)):
-                processes[j].join()
-        else:
+        # Map the interpolation type to the method doing the interpolation. The linear and the
+        # random-walk interpolation are cheap enough to be done for the entire dataset at once,
+        # whereas the cubic and the kinematic interpolation are handed out to a pool of processes.
+        ip_funcs = {'linear': Interpolation._linear_ip,
+                    'cubic': Interpolation._cubic_ip,
+                    'kinematic': Interpolation._kinematic_ip,
+                    'random-walk': Interpolation._random_walk_ip}
+        ip_func = ip_funcs.get(ip_type.lower().strip())
+        if ip_func is None:
             raise ValueError(f"Interpolation type: {ip_type} specified does not exist. Please check the"
                              "interpolation type specified and type again.")
 
-        return NumTrajDF(pd.concat(return_list).reset_index(),
+        return NumTrajDF(ip_func(dataframe, sampling_rate, class_label_col),
                          const.LAT, const.LONG, const.DateTime, const.TRAJECTORY_ID)
 
     @staticmethod
-    def _linear_ip(dataframe: Union[pd.DataFrame, NumTrajDF], sampling_rate: float,
-                   return_list: list, class_label_col):
+    def _cubic_ip(dataframe: Union[pd.DataFrame, NumTrajDF], sampling_rate: float, class_label_col):
         """
-            Interpolate the position of points using the Linear Interpolation method. It makes
-            the use of numpy's interpolation technique for the interpolation of the points.
+            Interpolate the position of points using the Cubic Spline Interpolation method.
 
-            WARNING: Do not use this method directly as it will run slower. Instead,
-                     use the method interpolate_position() and specify the ip_type as
-                     linear to perform linear interpolation much faster.
+            WARNING: Do not use this method directly. Instead, use the method
+                     interpolate_position() and specify the ip_type as cubic.
 
             Parameters
             ----------
                 dataframe: PTRAILDataFrame
                     The dataframe containing the original data.
                 sampling_rate: float
-                    The maximum time difference between 2 points. If the time difference between
-                    2 consecutive points is greater than the time jump, then another point will
-                    be inserted between the given 2 points.
-                return_list: list
-                    The list used by the Multiprocessing manager to get the return values
+                    The maximum time difference between 2 consecutive points.
                 class_label_col: Optional[Text], default = ''
                     The column header which contains the class label of the point.
 
@@ -159,218 +111,326 @@ class Interpolation:
                 pandas.core.dataframe.DataFrame:
                     The dataframe enhanced with interpolated points.
         """
-        # First, reset the index, extract the Latitude, Longitude, DateTime and Trajectory ID columns
-        # and set the DateTime column only as the index. Then, store all the unique Trajectory IDs in
-        # a list.
-        if class_label_col == '':
-            dataframe = dataframe.reset_index()[
-                [const.DateTime, const.TRAJECTORY_ID, const.LAT, const.LONG]].set_index(const.DateTime)
-        else:
-            dataframe = dataframe.reset_index()[
-                [const.DateTime, const.TRAJECTORY_ID, const.LAT, const.LONG, class_label_col]].set_index(const.DateTime)
-
-        # Split the smaller dataframe further into smaller chunks containing only 1
-        # Trajectory ID per index.
-        ids_ = list(dataframe[const.TRAJECTORY_ID].value_counts().keys())
-        df_chunks = [dataframe.loc[dataframe[const.TRAJECTORY_ID] == ids_[i]] for i in range(len(ids_))]
-
-        # Here, create as many processes at once as there are number of CPUs available in
-        # the system - 1. One CPU is kept free at all times in order to not block up
-        # the system. (Note: The blocking of system is mostly prevalent in Windows and does
-        # not happen very often in Linux. However, out of caution 1 CPU is kept free regardless
-        # of the system.)
-        small_pool = mlp.Pool(NUM_CPU)
-        final = small_pool.starmap(helper.linear_help,
-                                   zip(df_chunks, ids_, itertools.repeat(sampling_rate),
-                                       itertools.repeat(class_label_col)))
-        small_pool.close()
-        small_pool.join()
-
-        # Append the smaller dataframe to process manager list so that result
-        # can be finally merged into a larger dataframe.
-        return_list.append(pd.concat(final))
+        return Interpolation._pool_ip(dataframe, sampling_rate, class_label_col, helper._cubic_points)
 
     @staticmethod
-    def _cubic_ip(dataframe: Union[pd.DataFrame, NumTrajDF],
-                  sampling_rate: float, return_list: list, class_label_col):
-        try:
-            """
-                Method for cubic interpolation of a dataframe based on the time jump provided.
-                It makes use of scipy library's CubicSpline functionality and interpolates
-                the coordinates based on the Datetime of the dataframe.
-    
-                WARNING: Do not use this method directly as it will run slower. Instead,
-                         use the method interpolate_position() and specify the ip_type as
-                         cubic to perform cubic interpolation much faster.
-    
-                Parameters
-                ----------
-                    dataframe: Union[pd.DataFrame, NumTrajDF]
-                        The dataframe on which interpolation is to be performed
-                    sampling_rate: float
-                        The maximum time difference allowed to have between rows
-                    return_list: list
-                        The list used by the Multiprocessing manager to get the return values
-                    class_label_col: Optional[Text], default = ''
-                        The column header which contains the class label of the point.
-
-                Returns
-                -------
-                    pandas.core.dataframe.DataFrame:
-                        The dataframe containing the new interpolated points.
-    
-            """
-            # First, reset the index, extract the Latitude, Longitude, DateTime and Trajectory ID columns
-            # and set the DateTime column only as the index. Then, store all the unique Trajectory IDs in
-            # a list.
-            if class_label_col == '':
-                dataframe = dataframe.reset_index()[
-                    [const.DateTime, const.TRAJECTORY_ID, const.LAT, const.LONG]].set_index(const.DateTime)
-            else:
-                dataframe = dataframe.reset_index()[
-                    [const.DateTime, const.TRAJECTORY_ID, const.LAT, const.LONG, class_label_col]].set_index(
-                    const.DateTime)
-
-            # Split the smaller dataframe further into smaller chunks containing only 1
-            # Trajectory ID per index.
-            ids_ = list(dataframe[const.TRAJECTORY_ID].value_counts().keys())
-            df_chunks = [dataframe.loc[dataframe[const.TRAJECTORY_ID] == ids_[i]] for i in range(len(ids_))]
-
-            # Here, create as many processes at once as there are number of CPUs available in
-            # the system - 1. One CPU is kept free at all times in order to not block up
-            # the system. (Note: The blocking of system is mostly prevalent in Windows and does
-            # not happen very often in Linux. However, out of caution 1 CPU is kept free regardless
-            # of the system.).
-            small_pool = mlp.Pool(NUM_CPU)
-            final = small_pool.starmap(helper.cubic_help,
-                                       zip(df_chunks, ids_,
-                                           itertools.repeat(sampling_rate), itertools.repeat(class_label_col)))
-            small_pool.close()
-            small_pool.join()
-
-            # Append the smaller dataframe to process manager list so that result
-            # can be finally merged into a larger dataframe.
-            return_list.append(pd.concat(final))
-
-        except ValueError:
-            raise ValueError
+    def _kinematic_ip(dataframe: Union[pd.DataFrame, NumTrajDF], sampling_rate: float, class_label_col):
+        """
+            Interpolate the position of points using the Kinematic Interpolation method.
+
+            WARNING: Do not use this method directly. Instead, use the method
+                     interpolate_position() and specify the ip_type as kinematic.
+
+            Parameters
+            ----------
+                dataframe: PTRAILDataFrame
+                    The dataframe containing the original data.
+                sampling_rate: float
+                    The maximum time difference between 2 consecutive points.
+                class_label_col: Optional[Text], default = ''
+                    The column header which contains the class label of the point.
+
+            Returns
+            -------
+                pandas.core.dataframe.DataFrame:
+                    The dataframe enhanced with interpolated points.
+        """
+        return Interpolation._pool_ip(dataframe, sampling_rate, class_label_col, helper._kinematic_points)
 
     @staticmethod
-    def _kinematic_ip(dataframe: Union[pd.DataFrame, NumTrajDF],
-                      sampling_rate, return_list, class_label_col):
+    def _pool_ip(dataframe: Union[pd.DataFrame, NumTrajDF], sampling_rate: float, class_label_col, ip_func):
         """
-             Method for Kinematic interpolation of a dataframe based on the time jump provided.
-             It interpolates the coordinates based on the Datetime of the dataframe.
-
-             WARNING: Do not use this method directly as it will run slower. Instead,
-                     use the method interpolate_position() and specify the ip_type as
-                     kinematic to perform kinematic interpolation much faster.
-
-             Parameters
-             ----------
-                 dataframe: Union[pd.DataFrame, NumTrajDF]
-                     The dataframe on which interpolation is to be performed
-                 sampling_rate: float
-                     The maximum time difference allowed to have between rows
-                 return_list: list
-                     The list used by the Multiprocessing manager to get the return values
+            Interpolate the position of points of all the trajectories by handing them out to
+            the pool of processes shared by the preprocessing modules.
+
+            WARNING: Do not use this method directly. Instead, use the method
+                     interpolate_position().
+
+            Parameters
+            ----------
+                dataframe: PTRAILDataFrame
+                    The dataframe containing the original data.
+                sampling_rate: float
+                    The maximum time difference between 2 consecutive points.
                 class_label_col: Optional[Text], default = ''
                     The column header which contains the class label of the point.
+                ip_func: Callable
+                    The helper calculating the new points of a single trajectory.
+
+            Returns
+            -------
+                pandas.core.dataframe.DataFrame:
+                    The dataframe enhanced with interpolated points.
+        """
+        # First, lets extract the needed columns and convert the points into plain arrays in
+        # which the points of every trajectory are stored contiguously.
+        cols = [const.DateTime, const.TRAJECTORY_ID, const.LAT, const.LONG]
+        if class_label_col != '':
+            cols.append(class_label_col)
+        df = dataframe.reset_index()[cols]
+        order, ids_, bounds, times, lat, lon = Interpolation._to_soa(df)
+
+        # The new points are assigned the first class label of their trajectory.
+        if class_label_col != '':
+            labels = df[class_label_col].to_numpy()[order][bounds[:-1]]
+
+        # Now, copy the timestamps, latitudes and longitudes once into a shared memory block.
+        # Instead of pickling a dataframe per trajectory, the worker processes are only handed
+        # the name of the block along with the range of the rows of their trajectory and they
+        # read the points directly from the shared memory.
+        shm = shared_memory.SharedMemory(create=True, size=max(3 * len(df) * 8, 1))
+        block = None
+        try:
+            block = np.ndarray((3, len(df)), dtype=np.float64, buffer=shm.buf)
+            block[0].view(np.int64)[:] = times
+            block[1] = lat
+            block[2] = lon
+
+            # Map the trajectories to the selected interpolation method using the pool of
+            # processes shared by the preprocessing modules. Each task interpolates a batch of
+            # trajectories and hands the new points of all of them back as a single set of
+            # arrays, so that only a few large results are sent back to the main process.
+            split_factor = helper._get_partition_size(len(ids_))
+            batches = [bounds[i:i + split_factor + 1] for i in range(0, len(ids_), split_factor)]
+            results = helper._get_pool().starmap(
+                Interpolation._shared_ip,
+                zip(itertools.repeat(ip_func), itertools.repeat(shm.name), itertools.repeat(len(df)),
+                    batches, itertools.repeat(sampling_rate)))
+        finally:
+            # Drop the view on the buffer first, otherwise the block cannot be closed.
+            block = None
+            shm.close()
+            shm.unlink()
+
+        # Finally, concatenate the arrays of the new points of all the batches and
+        # append them to the original points in one go.
+        counts = np.concatenate([r[3] for r in results])
+        new_points = pd.DataFrame({const.DateTime: np.concatenate([r[0] for r in results]).view('datetime64[ns]'),
+                                   const.TRAJECTORY_ID: np.repeat(ids_.to_numpy(), counts),
+                                   const.LAT: np.concatenate([r[1] for r in results]),
+                                   const.LONG: np.concatenate([r[2] for r in results])})
+        if class_label_col != '':
+            new_points[class_label_col] = np.repeat(labels, counts)
+
+        return pd.concat([df, new_points], ignore_index=True)
+
+    @staticmethod
+    def _to_soa(df: pd.DataFrame):
+        """
+            Convert the points of the dataframe into separate arrays of timestamps, latitudes
+            and longitudes in which the points of every trajectory are stored contiguously,
+            while keeping the order of the points within the trajectories. The range of the
+            points of the i-th trajectory in the arrays is given by offsets[i]:offsets[i + 1].
+
+            Parameters
+            ----------
+                df: pandas.core.dataframe.DataFrame
+                    The dataframe containing the DateTime, Trajectory ID, Latitude and
+                    Longitude columns.
+
+            Returns
+            -------
+                tuple:
+                    The order in which the rows of the dataframe are stored in the arrays,
+                    the Trajectory IDs, the offsets of the trajectories and the int64
+                    nanosecond timestamps, latitudes and longitudes of the points.
+        """
+        codes, ids_ = pd.factorize(df[const.TRAJECTORY_ID], sort=False)
+        order = np.argsort(codes, kind='stable')
+        offsets = np.searchsorted(codes[order], np.arange(len(ids_) + 1))
+        return (order, ids_, offsets,
+                df[const.DateTime].values.view('i8')[order],
+                df[const.LAT].to_numpy(dtype=np.float64)[order],
+                df[const.LONG].to_numpy(dtype=np.float64)[order])
 
-             Returns
-             -------
-                 pandas.core.dataframe.DataFrame:
-                     The dataframe containing the new interpolated points.
-
-         """
-        # First, reset the index, extract the Latitude, Longitude, DateTime and Trajectory ID columns
-        # and set the DateTime column only as the index. Then, store all the unique Trajectory IDs in
-        # a list.
-        if class_label_col == '':
-            dataframe = dataframe.reset_index()[
-                [const.DateTime, const.TRAJECTORY_ID, const.LAT, const.LONG]].set_index(const.DateTime)
-        else:
-            dataframe = dataframe.reset_index()[
-                [const.DateTime, const.TRAJECTORY_ID, const.LAT, const.LONG, class_label_col]].set_index(const.DateTime)
-
-        # Split the smaller dataframe further into smaller chunks containing only 1
-        # Trajectory ID per index.
-        ids_ = list(dataframe[const.TRAJECTORY_ID].value_counts().keys())
-        df_chunks = [dataframe.loc[dataframe[const.TRAJECTORY_ID] == ids_[i]] for i in range(len(ids_))]
-
-        # Here, create as many processes at once as there are number of CPUs available in
-        # the system - 1. One CPU is kept free at all times in order to not block up
-        # the system. (Note: The blocking of system is mostly prevalent in Windows and does
-        # not happen very often in Linux. However, out of caution 1 CPU is kept free regardless
-        # of the system.).
-        small_pool = mlp.Pool(NUM_CPU)
-        final = small_pool.starmap(helper.kinematic_help,
-                                   zip(df_chunks, ids_, itertools.repeat(sampling_rate),
-                                       itertools.repeat(class_label_col)))
-        small_pool.close()
-        small_pool.join()
-
-        # Append the smaller dataframe to process manager list so that result
-        # can be finally merged into a larger dataframe.
-        return_list.append(pd.concat(final))
+    @staticmethod
+    def _shared_ip(ip_func, shm_name: Text, size: int, offsets, sampling_rate: float):
+        """
+            Read the points of a batch of trajectories from the shared memory block created by
+            interpolate_position() and interpolate them using the given interpolation helper.
+            The helpers work directly on the arrays of the trajectories, so no dataframe is
+            created in the worker processes.
+
+            WARNING: Do not use this method directly. It is the task that is run by the worker
+                     processes of interpolate_position().
+
+            Parameters
+            ----------
+                ip_func: Callable
+                    The interpolation helper that is to be used.
+                shm_name: Text
+                    The name of the shared memory block containing the timestamps, latitudes
+                    and longitudes of all the points.
+                size: int
+                    The total number of points stored in the shared memory block.
+                offsets: numpy.ndarray
+                    The offsets of the trajectories of the batch in the block, the points
+                    of the i-th trajectory being stored at offsets[i]:offsets[i + 1].
+                sampling_rate: float
+                    The maximum time difference between 2 consecutive points.
+
+            Returns
+            -------
+                tuple:
+                    The int64 nanosecond timestamps, latitudes and longitudes of the
+                    new points interpolated in the trajectories along with the number
+                    of new points of each of the trajectories.
+        """
+        shm = shared_memory.SharedMemory(name=shm_name)
+        try:
+            block = np.ndarray((3, size), dtype=np.float64, buffer=shm.buf)
+
+            # Copy the points of the trajectories out of the shared memory block so that the
+            # block can be closed safely.
+            start, end = offsets[0], offsets[-1]
+            times = block[0, start:end].view(np.int64).copy()
+            lat = block[1, start:end].copy()
+            lon = block[2, start:end].copy()
+            del block
+        finally:
+            shm.close()
+
+        offsets = offsets - start
+        results = [ip_func(times[i:j], lat[i:j], lon[i:j], sampling_rate)
+                   for i, j in zip(offsets[:-1], offsets[1:])]
+        return (np.concatenate([r[0] for r in results]),
+                np.concatenate([r[1] for r in results]),
+                np.concatenate([r[2] for r in results]),
+                np.array([len(r[0]) for r in results], dtype=np.int64))
 
     @staticmethod
-    def _random_walk_ip(dataframe: Union[pd.DataFrame, NumTrajDF],
-                        sampling_rate, return_list, class_label_col):
+    def _linear_ip(dataframe: Union[pd.DataFrame, NumTrajDF], sampling_rate: float,
+                   class_label_col):
         """
-             Method for Random walk interpolation of a dataframe based on the time jump provided.
-             It interpolates the coordinates based on the Datetime of the dataframe.
-
-             WARNING: Do not use this method directly as it will run slower. Instead,
-                     use the method interpolate_position() and specify the ip_type as
-                     random-walk to perform random walk interpolation much faster.
-
-
-             Parameters
-             ----------
-                 dataframe: Union[pd.DataFrame, NumTrajDF]
-                     The dataframe on which interpolation is to be performed
-                 sampling_rate: float
-                     The maximum time difference allowed to have between rows
-                 return_list: list
-                     The list used by the Multiprocessing manager to get the return values
+            Interpolate the position of points using the Linear Interpolation method. Since
+            the new points are always inserted between 2 consecutive points of a trajectory,
+            the interpolation is done for all the trajectories of the dataset at once using
+            numpy array operations, the same way as numpy.interp() would interpolate them.
+
+            WARNING: Do not use this method directly. Instead, use the method
+                     interpolate_position() and specify the ip_type as linear.
+
+            Parameters
+            ----------
+                dataframe: PTRAILDataFrame
+                    The dataframe containing the original data.
+                sampling_rate: float
+                    The maximum time difference between 2 points. If the time difference between
+                    2 consecutive points is greater than the time jump, then another point will
+                    be inserted between the given 2 points.
                 class_label_col: Optional[Text], default = ''
                     The column header which contains the class label of the point.
 
-             Returns
-             -------
-                 pandas.core.dataframe.DataFrame:
-                     The dataframe containing the new interpolated points.
-
-         """
-        # First, reset the index, extract the Latitude, Longitude, DateTime and Trajectory ID columns
-        # and set the DateTime column only as the index. Then, store all the unique Trajectory IDs in
-        # a list.
-        if class_label_col == '':
-            dataframe = dataframe.reset_index()[
-                [const.DateTime, const.TRAJECTORY_ID, const.LAT, const.LONG]].set_index(const.DateTime)
-        else:
-            dataframe = dataframe.reset_index()[
-                [const.DateTime, const.TRAJECTORY_ID, const.LAT, const.LONG, class_label_col]].set_index(const.DateTime)
-
-        # Split the smaller dataframe further into smaller chunks containing only 1
-        # Trajectory ID per index.
-        ids_ = list(dataframe[const.TRAJECTORY_ID].value_counts().keys())
-        df_chunks = [dataframe.loc[dataframe[const.TRAJECTORY_ID] == ids_[i]] for i in range(len(ids_))]
-
-        # Here, create as many processes at once as there are number of CPUs available in
-        # the system - 1. One CPU is kept free at all times in order to not block up
-        # the system. (Note: The blocking of system is mostly prevalent in Windows and does
-        # not happen very often in Linux. However, out of caution 1/3rds of CPU are kept free
-        # regardless of the system.).
-        small_pool = mlp.Pool(NUM_CPU)
-        final = small_pool.starmap(helper.random_walk_help,
-                                   zip(df_chunks, ids_, itertools.repeat(sampling_rate),
-                                       itertools.repeat(class_label_col)))
-        small_pool.close()
-        small_pool.join()
-
-        # Append the smaller dataframe to process manager list so that result
-        # can be finally merged into a larger dataframe.
-        return_list.append(pd.concat(final))
+            Returns
+            -------
+                pandas.core.dataframe.DataFrame:
+                    The dataframe enhanced with interpolated points.
+        """
+        # First, reset the index and extract the Latitude, Longitude, DateTime and Trajectory ID
+        # columns along with the class label column if needed.
+        cols = [const.DateTime, const.TRAJECTORY_ID, const.LAT, const.LONG]
+        if class_label_col != '':
+            cols.append(class_label_col)
+        df = dataframe.reset_index()[cols]
+
+        # Order the points so that the points of every trajectory are contiguous while
+        # keeping the order of the points within the trajectories.
+        codes, _ = pd.factorize(df[const.TRAJECTORY_ID], sort=False)
+        order = np.argsort(codes, kind='stable')
+        codes = codes[order]
+        times = df[const.DateTime].values.view('i8')[order]
+        lat = df[const.LAT].to_numpy(dtype=np.float64)[order]
+        lon = df[const.LONG].to_numpy(dtype=np.float64)[order]
+
+        # Find all the points after which the next point of the same trajectory is more
+        # than sampling_rate seconds away and calculate the times of the new points as
+        # follows:
+        #    new_time[i] = original_time[i] + sampling_rate.
+        offset = round(sampling_rate * 1e9)
+        gaps = np.flatnonzero((codes[1:] == codes[:-1]) & (times[1:] - times[:-1] > offset))
+        new_times = times[gaps] + offset
+
+        # Now, linearly interpolate the latitudes and longitudes between the 2 points
+        # surrounding each of the new points.
+        x, x0, x1 = new_times.astype(np.float64), times[gaps].astype(np.float64), times[gaps + 1].astype(np.float64)
+        ip_lat = (lat[gaps + 1] - lat[gaps]) / (x1 - x0) * (x - x0) + lat[gaps]
+        ip_long = (lon[gaps + 1] - lon[gaps]) / (x1 - x0) * (x - x0) + lon[gaps]
+
+        new_points = pd.DataFrame({const.DateTime: new_times.view('datetime64[ns]'),
+                                   const.TRAJECTORY_ID: df[const.TRAJECTORY_ID].to_numpy()[order][gaps],
+                                   const.LAT: ip_lat,
+                                   const.LONG: ip_long})
+
+        # The new points are assigned the class label of the first point of their trajectory.
+        if class_label_col != '':
+            _, first = np.unique(codes, return_index=True)
+            new_points[class_label_col] = df[class_label_col].to_numpy()[order][first][codes[gaps]]
+
+        return pd.concat([df, new_points], ignore_index=True)
+
+    @staticmethod
+    def _random_walk_ip(dataframe: Union[pd.DataFrame, NumTrajDF], sampling_rate: float,
+                        class_label_col):
+        """
+            Interpolate the position of points using the Random-Walk Interpolation method for
+            all the trajectories of the dataset at once. A single random step is drawn for every
+            trajectory from the distribution of the distances and bearings between its
+            consecutive points and every new point is placed that step away from the point
+            before it.
+
+            WARNING: Do not use this method directly. Instead, use the method
+                     interpolate_position() and specify the ip_type as random-walk.
+
+            Parameters
+            ----------
+                dataframe: PTRAILDataFrame
+                    The dataframe containing the original data.
+                sampling_rate: float
+                    The maximum time difference between 2 points. If the time difference between
+                    2 consecutive points is greater than the time jump, then another point will
+                    be inserted between the given 2 points.
+                class_label_col: Optional[Text], default = ''
+                    The column header which contains the class label of the point.
 
+            Returns
+            -------
+                pandas.core.dataframe.DataFrame:
+                    The dataframe enhanced with interpolated points.
+        """
+        # First, reset the index and extract the Latitude, Longitude, DateTime and Trajectory ID
+        # columns along with the class label column if needed.
+        cols = [const.DateTime, const.TRAJECTORY_ID, const.LAT, const.LONG]
+        if class_label_col != '':
+            cols.append(class_label_col)
+        df = dataframe.reset_index()[cols]
+        order, ids_, offsets, times, lat, lon = Interpolation._to_soa(df)
+        sizes = np.diff(offsets)
+        codes = np.repeat(np.arange(len(ids_)), sizes)
+
+        # Calculate the mean and standard deviation of the distances and bearings of every
+        # trajectory and draw the random step of each of the trajectories.
+        d_mean, d_std, b_mean, b_std = _traj_dist_bearing_stats(offsets, lat, lon)
+        calc_a = np.random.normal(d_mean, d_std) / 1000
+        calc_b = np.radians(np.random.normal(b_mean, b_std))
+        dy_deg = (calc_a * np.cos(calc_b) / const.RADIUS_OF_EARTH) * (180 / np.pi)
+        dx_deg = (calc_a * np.sin(calc_b) / const.RADIUS_OF_EARTH) * (180 / np.pi)
+
+        # Find all the points of the trajectories with more than 3 points after which the next
+        # point of the same trajectory is more than sampling_rate seconds away and calculate
+        # the times of the new points as follows:
+        #    new_time[i] = original_time[i] + sampling_rate.
+        offset = round(sampling_rate * 1e9)
+        gaps = np.flatnonzero((codes[1:] == codes[:-1]) & (sizes[codes[1:]] > 3)
+                              & (times[1:] - times[:-1] > offset))
+        gap_codes = codes[gaps]
+
+        new_points = pd.DataFrame({const.DateTime: (times[gaps] + offset).view('datetime64[ns]'),
+                                   const.TRAJECTORY_ID: ids_.to_numpy()[gap_codes],
+                                   const.LAT: lat[gaps] + dy_deg[gap_codes],
+                                   const.LONG: lon[gaps] + dx_deg[gap_codes] / np.cos(lat[gaps] * np.pi / 180)})
+
+        # The new points are assigned the class label of the first point of their trajectory.
+        if class_label_col != '':
+            new_points[class_label_col] = df[class_label_col].to_numpy()[order][offsets[:-1]][gap_codes]
+
+        return pd.concat([df, new_points], ignore_index=True)
@@ -16,13 +16,6 @@ from ptrail.core.TrajectoryDF import PTRAILDataFrame
 from ptrail.features.kinematic_features import KinematicFeatures
 from ptrail.preprocessing.helpers import Helpers as helpers
 import ptrail.utilities.constants as const
-from math import ceil
-
-import multiprocessing
-import os
-
-num = os.cpu_count()
-NUM_CPU = ceil((num * 2) / 3)
 
 
 class Statistics:
@@ -45,21 +38,20 @@ class Statistics:
                     The dataframe containing segmented trajectories
                     with a new column added called segment_id
         """
-        # splitting the dataframe according to trajectory ids
-        df_chunks = helpers._df_split_helper(dataframe=dataframe.reset_index())
-
-        # Here, create 2/3rds number of processes as there are in the system. Some CPUs are
-        # kept free at all times in order to not block up the system.
-        # (Note: The blocking of system is mostly prevalent in Windows and does not happen very often
-        # in Linux. However, out of caution some CPUs are kept free regardless of the system.)
-        pool = multiprocessing.Pool(NUM_CPU)
-        results = pool.starmap(helpers.split_traj_helper, zip(df_chunks, itertools.repeat(num_days)))
-        pool.close()
-        pool.join()
-
-        to_return = pd.concat(results).reset_index().set_index(['traj_id', 'seg_id', 'DateTime'])
-
-        return to_return.drop(columns=['index'])
+        # Split the dataframe into smaller chunks containing 1 trajectory each so that
+        # every trajectory is segmented independently by the worker processes. The
+        # chunks keep the [traj_id, DateTime] index, so the dataframe is not reset.
+        df_chunks = [traj for _, traj in dataframe.groupby(level=const.TRAJECTORY_ID, sort=False)]
+
+        # Here, segment the trajectories using the pool of processes shared by the
+        # preprocessing modules. The pool has 2/3rds number of processes as there are in
+        # the system in order to not block up the system.
+        results = helpers._get_pool().starmap(helpers._segment_indexed_traj,
+                                              zip(df_chunks, itertools.repeat(num_days)))
+
+        # Merge the segments of all the trajectories which are already indexed by
+        # [traj_id, seg_id, DateTime].
+        return pd.concat(results)
 
     @staticmethod
     def generate_kinematic_stats(dataframe: PTRAILDataFrame, target_col_name: str, segmented: Optional[bool] = False):
@@ -86,38 +78,14 @@ class Statistics:
         # Generate kinematic features on the entire dataframe.
         ptdf = KinematicFeatures.generate_kinematic_features(dataframe)
 
-        # Then, lets break down the entire dataframe into pieces containing data of
-        # 1 trajectory in each piece.
-        ids_ = list(dataframe.reset_index().traj_id.value_counts().keys())
-        df_chunks = []
-
-        if segmented:
-            segments = ptdf.reset_index()['seg_id'].unique()
-            for i in range(len(ids_)):
-                for seg in segments:
-                    df = ptdf.reset_index().loc[(ptdf.reset_index()['traj_id'] == ids_[i])
-                                                & (ptdf.reset_index()['seg_id'] == seg)]
-                    if len(df) > 0:
-                        df_chunks.append(df)
-                    else:
-                        continue
-        else:
-            for i in range(len(ids_)):
-                small_df = ptdf.reset_index().loc[ptdf.reset_index()[const.TRAJECTORY_ID] == ids_[i]]
-                df_chunks.append(small_df)
-
-        # Here, create 2/3rds number of processes as there are in the system. Some CPUs are
-        # kept free at all times in order to not block up the system.
-        # (Note: The blocking of system is mostly prevalent in Windows and does not happen very often
-        # in Linux. However, out of caution some CPUs are kept free regardless of the system.)
-        mp_pool = multiprocessing.Pool(NUM_CPU)
-        results = mp_pool.starmap(helpers.stats_helper, zip(df_chunks,
-                                                            itertools.repeat(target_col_name),
-                                                            itertools.repeat(segmented)))
-        mp_pool.close()
-        mp_pool.join()
+        # Then, calculate the stats of all the trajectories (or segments) at once and
+        # arrange them in the order in which the trajectories appear in the dataframe.
+        # The trajectory IDs are read directly from the index so that the entire
+        # dataframe is not copied by a reset_index() only to list them.
+        ids_ = pd.unique(dataframe.index.get_level_values(const.TRAJECTORY_ID))
+        stats = helpers.stats_helper_many(ptdf, target_col_name, segmented)
 
-        return pd.concat(results)
+        return stats.reindex(ids_, level='traj_id')
 
     @staticmethod
     def pivot_stats_df(dataframe, target_col_name: str, segmented: Optional[bool] = False):
@@ -145,56 +113,24 @@ class Statistics:
                 pd.core.dataframe.DataFrame:
                     The dataframe above which is pivoted and has rows converted to columns.
         """
-        # Get all the unique trajectory IDs.
-        ids_ = list(dataframe.index.get_level_values('traj_id').unique())
-
-        final_chunks = []
-        if not segmented:
-            for val in ids_:
-                # separated the data for each trajectory id.
-                small = dataframe.loc[dataframe.index.get_level_values('traj_id') == val].reset_index().set_index(
-                    'traj_id')
-
-                # Get the target value out and drop the target column.
-                target = small[target_col_name].iloc[0]
-                small = small.drop(columns=[target_col_name])
-
-                # Pivot the table now and adjust the column names.
-                pivoted = small.reset_index().pivot_table(index='traj_id', columns='Columns')
-                pivoted.columns = pivoted.columns.map('_'.join).str.strip('|')
-
-                # Assign the target column again.
-                pivoted[target_col_name] = target
-                final_chunks.append(pivoted)
-        else:
-            for val in ids_:
-                segments = dataframe.index.get_level_values('seg_id').unique()
-                for seg in segments:
-                    small = dataframe.loc[(dataframe.index.get_level_values('traj_id') == val) &
-                                          (dataframe.index.get_level_values('seg_id') == seg)].reset_index().set_index(['traj_id', 'seg_id'])
-
-                    if len(small) <= 0:
-                        continue
-
-                    # Get the target value out and drop the target column.
-                    target = small[target_col_name].iloc[0]
-                    small = small.drop(columns=[target_col_name])
-
-                    # Pivot the table now and adjust the column names.
-                    pivoted = small.reset_index().pivot_table(index=['traj_id', 'seg_id'], columns='Columns')
-                    pivoted.columns = pivoted.columns.map('_'.join).str.strip('|')
-
-                    # Assign the target column again.
-                    pivoted[target_col_name] = target
-                    final_chunks.append(pivoted)
-
-        # Concatenate the smaller chunks and reorder the columns.
-        to_return = pd.concat(final_chunks)
+        # Get the columns identifying each trajectory (or segment) and then get the
+        # target value of each of them out in the order in which they appear.
+        index = ['traj_id', 'seg_id'] if segmented else ['traj_id']
+        df = dataframe.reset_index()
+        targets = df.drop_duplicates(subset=index).set_index(index)[target_col_name]
+
+        # Pivot the entire table at once now and adjust the column names.
+        pivoted = df.drop(columns=[target_col_name]).pivot_table(index=index, columns='Columns')
+        pivoted.columns = pivoted.columns.map('_'.join).str.strip('|')
+
+        # Restore the order of the trajectories (or segments) and assign the target
+        # column again.
+        to_return = pivoted.reindex(targets.index[targets.index.isin(pivoted.index)])
+        to_return[target_col_name] = targets.reindex(to_return.index).values
 
         # Store the correct order of the columns to a variable and add the name
         # of the target column to the end of it.
-        cols = const.ORDERED_COLS
-        cols.append(target_col_name)
+        cols = const.ORDERED_COLS + [target_col_name]
 
         # Reorder the final DF, drop duplicated columns and return it.
         to_return = to_return[cols]
@@ -0,0 +1,60 @@
+from functools import lru_cache
+from pathlib import Path
+
+import pandas as pd
+
+from ptrail.core.TrajectoryDF import PTRAILDataFrame
+from ptrail.features.kinematic_features import KinematicFeatures
+
+_DATA_DIR = Path(__file__).resolve().parents[3] / 'examples' / 'data'
+_DATA_URL = 'https://raw.githubusercontent.com/YakshHaranwala/PTRAIL/main/examples/data/'
+
+
+def _read_dataset(name):
+    # Prefer the copy of the dataset in the repository and only download it
+    # when the tests are run outside of a checkout. Only the mandatory columns
+    # are read as the tests do not use any of the other ones.
+    path = _DATA_DIR / name
+    return pd.read_csv(path if path.exists() else _DATA_URL + name,
+                       usecols=['traj_id', 'DateTime', 'lat', 'lon'])
+
+
+@lru_cache(maxsize=None)
+def gulls():
+    # The seagulls dataset is shared by the filters and the interpolation tests,
+    # hence it is read and converted only once per process.
+    pdf_data = _read_dataset('seagulls.csv')
+    return PTRAILDataFrame(data_set=pdf_data,
+                           latitude='lat',
+                           longitude='lon',
+                           datetime='DateTime',
+                           traj_id='traj_id',
+                           rest_of_columns=[])
+
+
+@lru_cache(maxsize=None)
+def atlantic():
+    pdf_data = _read_dataset('atlantic_hurricanes.csv')
+    return PTRAILDataFrame(pdf_data,
+                           latitude='lat',
+                           longitude='lon',
+                           datetime='DateTime',
+                           traj_id='traj_id',
+                           rest_of_columns=[])
+
+
+@lru_cache(maxsize=None)
+def gulls_speed():
+    # The filters do not modify the dataframes given to them, so the kinematic
+    # features needed by the tests are generated only once for all of them.
+    return KinematicFeatures.create_speed_column(gulls())
+
+
+@lru_cache(maxsize=None)
+def gulls_dist():
+    return KinematicFeatures.create_distance_column(dataframe=gulls())
+
+
+@lru_cache(maxsize=None)
+def atlantic_dist():
+    return KinematicFeatures.create_distance_column(atlantic())
@@ -1,29 +1,34 @@
 import unittest
-from ptrail.core.TrajectoryDF import PTRAILDataFrame
 from ptrail.preprocessing.filters import Filters
 from ptrail.features.temporal_features import TemporalFeatures
-from ptrail.features.kinematic_features import KinematicFeatures
 from ptrail.utilities.exceptions import *
 from ptrail.preprocessing.helpers import Helpers
-import pandas as pd
+from ptrail.preprocessing.tests._fixtures import atlantic, atlantic_dist, gulls, gulls_dist, gulls_speed
+import numpy as np
 
 
 class FiltersTest(unittest.TestCase):
-    _pdf_data = pd.read_csv('https://raw.githubusercontent.com/YakshHaranwala/PTRAIL/main/examples/data/seagulls.csv')
-    _gulls = PTRAILDataFrame(data_set=_pdf_data,
-                             latitude='location-lat',
-                             longitude='location-long',
-                             datetime='timestamp',
-                             traj_id='tag-local-identifier',
-                             rest_of_columns=[])
-
-    _atlantic = pd.read_csv('https://raw.githubusercontent.com/YakshHaranwala/PTRAIL/main/examples/data/atlantic_hurricanes.csv')
-    _atlantic = PTRAILDataFrame(_atlantic,
-                                latitude='lat',
-                                longitude='lon',
-                                datetime='DateTime',
-                                traj_id='traj_id',
-                                rest_of_columns=[])
+    # The datasets are only read when a test first needs them and are then
+    # shared with the other test modules of the preprocessing package.
+    @property
+    def _gulls(self):
+        return gulls()
+
+    @property
+    def _atlantic(self):
+        return atlantic()
+
+    @property
+    def _gulls_speed(self):
+        return gulls_speed()
+
+    @property
+    def _gulls_dist(self):
+        return gulls_dist()
+
+    @property
+    def _atlantic_dist(self):
+        return atlantic_dist()
 
     def test_remove_duplicates(self):
         remove_dupl = Filters.remove_duplicates(self._gulls)
@@ -42,7 +47,7 @@ class FiltersTest(unittest.TestCase):
     def test_get_bbox_by_radius(self):
         bbox = Filters.get_bounding_box_by_radius(lat=39, lon=116, radius=100000)
         expected = [38.100678394081264, 114.84275815636957, 39.89932160591873, 117.15724184363044]
-        self.assertListEqual(list(bbox), expected)
+        np.testing.assert_allclose(bbox, expected, rtol=1e-12)
 
     def test_filter_by_bbox(self):
         bbox = Filters.get_bounding_box_by_radius(lat=61, lon=24, radius=100000)
@@ -75,19 +80,19 @@ class FiltersTest(unittest.TestCase):
                                                  start_dateTime='2009-05-31 00:00:00')
 
     def test_filter_by_max_speed_positive(self):
-        new_df = KinematicFeatures.create_speed_column(self._gulls)
+        new_df = self._gulls_speed
         filt_df = Filters.filter_by_max_speed(dataframe=new_df,
                                               max_speed=5)
         self.assertGreaterEqual(len(new_df), len(filt_df))
 
     def test_filter_by_min_speed_positive(self):
-        new_df = KinematicFeatures.create_speed_column(self._gulls)
+        new_df = self._gulls_speed
         filt_df = Filters.filter_by_min_speed(dataframe=new_df,
                                               min_speed=1)
         self.assertGreaterEqual(len(new_df), len(filt_df))
 
     def test_filter_by_min_consecutive_distance_positive(self):
-        new_df = KinematicFeatures.create_distance_column(dataframe=self._gulls)
+        new_df = self._gulls_dist
         filt_df = Filters.filter_by_min_consecutive_distance(dataframe=new_df,
                                                              min_distance=1000)
         self.assertGreaterEqual(len(new_df), len(filt_df))
@@ -98,7 +103,7 @@ class FiltersTest(unittest.TestCase):
                                                                  min_distance=1000)
 
     def test_filter_by_max_consecutive_distance_positive(self):
-        new_df = KinematicFeatures.create_distance_column(dataframe=self._gulls)
+        new_df = self._gulls_dist
         filt_df = Filters.filter_by_max_consecutive_distance(dataframe=new_df,
                                                              max_distance=10000)
         self.assertGreaterEqual(len(new_df), len(filt_df))
@@ -109,26 +114,26 @@ class FiltersTest(unittest.TestCase):
                                                                  max_distance=10000)
 
     def test_filter_by_max_distance_and_speed_positive(self):
-        new_df = KinematicFeatures.create_speed_column(self._gulls)
+        new_df = self._gulls_speed
         filt_df = Filters.filter_by_max_distance_and_speed(dataframe=new_df,
                                                            max_speed=25,
                                                            max_distance=1000)
         self.assertGreaterEqual(len(new_df), len(filt_df))
 
     def test_filter_by_min_distance_and_speed_positive(self):
-        new_df = KinematicFeatures.create_speed_column(self._gulls)
+        new_df = self._gulls_speed
         filt_df = Filters.filter_by_min_distance_and_speed(dataframe=new_df,
                                                            min_speed=5,
                                                            min_distance=10)
         self.assertGreaterEqual(len(new_df), len(filt_df))
 
     def test_filter_outliers_by_consecutive_distance_positive(self):
-        new_df = KinematicFeatures.create_distance_column(dataframe=self._gulls)
+        new_df = self._gulls_dist
         filt_df = Filters.filter_outliers_by_consecutive_distance(dataframe=new_df)
         self.assertGreaterEqual(len(new_df), len(filt_df))
 
     def test_filter_outliers_by_consecutive_speed_positive(self):
-        new_df = KinematicFeatures.create_speed_column(dataframe=self._gulls)
+        new_df = self._gulls_speed
         filt_df = Filters.filter_outliers_by_consecutive_speed(dataframe=new_df)
         self.assertGreaterEqual(len(new_df), len(filt_df))
 
@@ -137,7 +142,7 @@ class FiltersTest(unittest.TestCase):
         self.assertGreater(len(self._atlantic), len(filt_df))
 
     def test_hampel_positive(self):
-        new_df = KinematicFeatures.create_distance_column(self._atlantic)
+        new_df = self._atlantic_dist
         filt_df = Filters.hampel_outlier_detection(dataframe=new_df,
                                                    column_name='Distance')
         self.assertGreater(len(self._atlantic), len(filt_df))
@@ -22,17 +22,20 @@ class Conversions:
                 Pr ́e-processamento Para Biblioteca Pymove”.Bachelor’s thesis. Universidade Federal Do Cear ́a, 2019"
         """
 
-        def decimal_degree_to_decimal(col):
-            if col[latitude][-1:] == 'N':
-                col[latitude] = float(col[latitude][:-1])
-            else:
-                col[latitude] = float(col[latitude][:-1]) * -1
-
-            if col[longitude][-1:] == 'E':
-                col[longitude] = float(col[longitude][:-1])
-            else:
-                col[longitude] = float(col[longitude][:-1]) * -1 + 360 if float(col[longitude][:-1]) * -1 < -180 \
-                    else float(col[longitude][:-1]) * -1
-            return col
-
-        return data.apply(decimal_degree_to_decimal, axis=1)
+        # Convert the entire columns at once using the pandas string methods instead of
+        # parsing the coordinates one row at a time. The numeric part of every coordinate
+        # is everything apart from the last character, which is the direction.
+        data = data.copy()
+        lat_values = data[latitude].str[:-1].astype(float)
+        lon_values = data[longitude].str[:-1].astype(float)
+
+        # The southern latitudes are negative.
+        data[latitude] = lat_values.where(data[latitude].str[-1:] == 'N', -lat_values)
+
+        # The western longitudes are negative and the ones smaller than -180 are
+        # wrapped around by adding 360 to them.
+        west = -lon_values
+        west = west.where(west >= -180, west + 360)
+        data[longitude] = lon_values.where(data[longitude].str[-1:] == 'E', west)
+
+        return data
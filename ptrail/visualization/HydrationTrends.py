@@ -14,6 +14,7 @@
 
     | Authors: Yaksh J Haranwala
 """
+import numpy as np
 import pandas as pd
 from IPython.core.display import display
 from ipywidgets import widgets, AppLayout
@@ -76,13 +77,12 @@ class HydrationTrends:
         water_bodies = a.loc[(a['DistEWat'] == 0)]
 
         # Add an extra column that has bounding boxes for all the water bodies.
-        bboxes = []
-        for i in range(len(water_bodies)):
-            lat = water_bodies.iloc[i]['lat']
-            lon = water_bodies.iloc[i]['lon']
-            bboxes.append(filt.get_bounding_box_by_radius(lat, lon, dist_from_water))
+        # The bounding boxes of all the water bodies are calculated at once.
+        bboxes = filt.get_bounding_box_by_radius(water_bodies['lat'].to_numpy(dtype=np.float64),
+                                                 water_bodies['lon'].to_numpy(dtype=np.float64),
+                                                 dist_from_water)
 
-        water_bodies['bbox'] = bboxes
+        water_bodies['bbox'] = list(zip(*bboxes))
 
         # Name all the water bodies and store their respective data rows in a dictionary.
         point_dict = dict()
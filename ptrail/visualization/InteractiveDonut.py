@@ -276,27 +276,19 @@ class InteractiveDonut:
         habitat_gdf.crs = "EPSG:4326"
         habitat_gdf = habitat_gdf.to_crs('EPSG:3857')
 
-        # Get a list of all the unique habitats.
-        habitats = habitat_gdf['CowPast'].unique()
+        # Group the points by pasture once and collect the areas in a list so that
+        # the result dataframe is built only once at the end.
+        areas = []
+        for val, small in habitat_gdf.groupby('CowPast', sort=False):
+            # Skip the nan pasture.
+            if type(val) != str:
+                continue
 
-        df = pd.DataFrame(columns=['pasture', 'area'])
-        for val in habitats:
             # the try catch does the job of ignoring the pasture with less
             # than 2 points.
             try:
-                small = habitat_gdf.loc[habitat_gdf['CowPast'] == val]
-
-                # Rename the nan pasture to STARK
-                if type(val) != str:
-                    continue
-
-                # Calculate the area and then append it to the dataframe.
-                df.loc[val] = Polygon(small['geometry'].tolist()).area / 10e6
+                areas.append([val, Polygon(small['geometry'].tolist()).area / 10e6])
             except ValueError:
                 continue
 
-        # Clear the trash out of the DF and return it.
-        df = df.reset_index().drop(columns=['pasture'])
-        df = df.rename(columns={'index': 'pasture'})
-
-        return df
+        return pd.DataFrame(areas, columns=['pasture', 'area'])
@@ -47,27 +47,27 @@ class StatViz:
         traj_ids = dataset.reset_index()['traj_id'].unique()
 
         # Now, for each of the traj_id in the list above, calculate the distance
-        # travelled by the moving object on that day and store it in a dictionary.
-        dist_df = pd.DataFrame(columns=['traj_id', 'distance'])
+        # travelled by the moving object per day and store it in a list of rows.
+        rows = []
         for val in traj_ids:
             try:
                 distance = kin.get_distance_travelled_by_traj_id(dataframe=dataset, traj_id=val)
                 duration = temp.get_traj_duration(dataframe=dataset, traj_id=val)
-                dist_df.loc[val] = distance / int(duration.dt.days)
+                rows.append([val, distance / int(duration.dt.days)])
 
             except KeyError:
                 # If the animal's trajectory is not recorded on the date given in, just skip it.
                 continue
 
-        # Drop the extra column that is acting as the traj ID and reset the index
-        # and rename the index column to be traj_id.
-        dist_df = dist_df.drop(columns=['traj_id']).reset_index().rename(columns={'index': 'traj_id'})
+        # Build the dataframe once from the collected rows instead of
+        # enlarging it for every traj_id.
+        dist_df = pd.DataFrame(rows, columns=['traj_id', 'distance'])
 
         species = []
-        for i in range(len(dist_df)):
-            if 'D' in dist_df.iloc[i]['traj_id']:
+        for traj_id in dist_df['traj_id']:
+            if 'D' in traj_id:
                 species.append('Deer')
-            elif 'E' in dist_df.iloc[i]['traj_id']:
+            elif 'E' in traj_id:
                 species.append('Elk')
             else:
                 species.append('Cattle')
@@ -5,7 +5,7 @@ with open('README.md', 'r') as f:
     LONG_DESCRIPTION = f.read()
 
 REQUIRED_PKGS = ['numpy >= 1.20',
-                 'hampel >= 0.0.5',
+                 'numba >= 0.53',
                  'pandas >= 1.2.5',
                  'scipy >= 1.6.2',
                  'folium >= 0.12',